@@ -1,8 +1,11 @@
 # Analytics service
+import hashlib
+from collections import Counter
 from typing import Dict, List, Tuple, Optional
 from django.contrib.auth.models import User
-from django.db.models import Avg, Count, Q
-from apps.resumes.models import Resume, ResumeAnalysis, OptimizationHistory
+from django.db import connection
+from django.db.models import Avg, Count, F, Q, RowRange, Window
+from apps.resumes.models import Resume, ResumeAnalysis, OptimizationHistory, PersonalInfo
 from apps.analyzer.services.action_verb_analyzer import ActionVerbAnalyzerService
 from apps.analyzer.services.quantification_detector import QuantificationDetectorService
 from .cache_utils import (
@@ -15,6 +18,31 @@ from .cache_utils import (
 )
 
 
+# Per-vendor SQL for AnalyticsService.get_top_missing_keywords
+_TOP_MISSING_KEYWORDS_SQL = {
+    'sqlite': (
+        'SELECT kw.value, COUNT(*) AS frequency '
+        'FROM {analysis_table} a '
+        'JOIN {resume_table} r ON r.id = a.resume_id, '
+        'json_each(a.missing_keywords) kw '
+        'WHERE r.user_id = %s '
+        'GROUP BY kw.value '
+        'ORDER BY frequency DESC, kw.value '
+        'LIMIT %s'
+    ),
+    'postgresql': (
+        'SELECT kw.value, COUNT(*) AS frequency '
+        'FROM {analysis_table} a '
+        'JOIN {resume_table} r ON r.id = a.resume_id '
+        'CROSS JOIN LATERAL jsonb_array_elements_text(a.missing_keywords) AS kw(value) '
+        'WHERE r.user_id = %s '
+        'GROUP BY kw.value '
+        'ORDER BY frequency DESC, kw.value '
+        'LIMIT %s'
+    ),
+}
+
+
 class AnalyticsService:
     """
     Service for calculating resume analytics and health metrics.
@@ -24,13 +52,47 @@ class AnalyticsService:
     Requirements: 18.3
     """
     
+    @staticmethod
+    def _health_inputs(resume: Resume) -> Tuple:
+        """
+        Collect exactly the resume content the health score is computed from.
+        
+        Section rows can be edited in place without touching
+        ``Resume.updated_at`` (optimizer apply, experience/personal info
+        edits), so the cache key is derived from this content rather than
+        from timestamps or row ids.
+        
+        Args:
+            resume: Resume instance
+            
+        Returns:
+            Tuple: (template, contact fields or None, experience descriptions,
+            has education, has skills)
+        """
+        try:
+            pi = resume.personal_info
+            contact = (pi.email, pi.phone, pi.location)
+        except PersonalInfo.DoesNotExist:
+            contact = None
+        descriptions = tuple(
+            resume.experiences.order_by('pk').values_list('description', flat=True)
+        )
+        return (
+            resume.template,
+            contact,
+            descriptions,
+            resume.education.exists(),
+            resume.skills.exists(),
+        )
+    
     @staticmethod
     def calculate_resume_health(resume: Resume) -> float:
         """
         Calculate overall resume health score (0-100).
         
         Uses caching to avoid recalculating for the same resume.
-        Cache is valid for 5 minutes.
+        Cache is valid for 5 minutes and is keyed on a hash of the scored
+        content, so any edit to that content forces a recalculation.
         
         Components:
         - Section completeness (40 points)
@@ -47,8 +109,12 @@ class AnalyticsService:
             
         Requirements: 18.3
         """
+        inputs = AnalyticsService._health_inputs(resume)
+        template, contact, descriptions, has_education, has_skills = inputs
+        
         # Try to get from cache first
-        cached_score = get_cached_resume_health(resume.id)
+        fingerprint = hashlib.md5(repr(inputs).encode('utf-8')).hexdigest()
+        cached_score = get_cached_resume_health(resume.id, fingerprint)
         if cached_score is not None:
             return cached_score
         
@@ -57,36 +123,31 @@ class AnalyticsService:
         
         # 1. Section completeness (40 points)
         sections = {
-            'personal_info': hasattr(resume, 'personal_info'),
-            'experiences': resume.experiences.exists(),
-            'education': resume.education.exists(),
-            'skills': resume.skills.exists(),
+            'personal_info': contact is not None,
+            'experiences': bool(descriptions),
+            'education': has_education,
+            'skills': has_skills,
         }
         completed_sections = sum(1 for has_content in sections.values() if has_content)
         health_score += (completed_sections / len(sections)) * 40
         
         # 2. Contact info completeness (15 points)
-        if hasattr(resume, 'personal_info'):
-            pi = resume.personal_info
-            contact_fields = [
-                bool(pi.email),
-                bool(pi.phone),
-                bool(pi.location),
-            ]
+        if contact is not None:
+            contact_fields = [bool(field) for field in contact]
             completed_contact = sum(contact_fields)
             health_score += (completed_contact / len(contact_fields)) * 15
         
         # 3. Quantified achievements (20 points)
-        total_bullets = 0
-        quantified_bullets = 0
-        
-        for experience in resume.experiences.all():
-            if experience.description:
-                bullets = [line.strip() for line in experience.description.split('\n') if line.strip()]
-                total_bullets += len(bullets)
-                for bullet in bullets:
-                    if QuantificationDetectorService.has_quantification(bullet):
-                        quantified_bullets += 1
+        bullets = [
+            line.strip()
+            for description in descriptions if description
+            for line in description.split('\n') if line.strip()
+        ]
+        total_bullets = len(bullets)
+        quantified_bullets = sum(
+            1 for bullet in bullets
+            if QuantificationDetectorService.has_quantification(bullet)
+        )
         
         if total_bullets > 0:
             health_score += (quantified_bullets / total_bullets) * 20
@@ -94,16 +155,13 @@ class AnalyticsService:
         # 4. Action verb usage (15 points)
         strong_verb_count = 0
         
-        for experience in resume.experiences.all():
-            if experience.description:
-                bullets = [line.strip() for line in experience.description.split('\n') if line.strip()]
-                for bullet in bullets:
-                    # Check if bullet starts with a strong action verb
-                    words = bullet.split()
-                    if words:
-                        first_word = words[0].lower().rstrip('.,;:')
-                        if first_word in ActionVerbAnalyzerService.STRONG_ACTION_VERBS:
-                            strong_verb_count += 1
+        for bullet in bullets:
+            # Check if bullet starts with a strong action verb
+            words = bullet.split()
+            if words:
+                first_word = words[0].lower().rstrip('.,;:')
+                if first_word in ActionVerbAnalyzerService.STRONG_ACTION_VERBS:
+                    strong_verb_count += 1
         
         if total_bullets > 0:
             health_score += (strong_verb_count / total_bullets) * 15
@@ -114,12 +172,12 @@ class AnalyticsService:
         
         # Check if template is ATS-friendly (professional, modern, classic are good)
         ats_friendly_templates = ['professional', 'modern', 'classic']
-        if resume.template in ats_friendly_templates:
+        if template in ats_friendly_templates:
             health_score += 10
         
         # Round and cache the result
         health_score = round(health_score, 2)
-        cache_resume_health(resume.id, health_score)
+        cache_resume_health(resume.id, health_score, fingerprint)
         
         return health_score
     
@@ -145,10 +203,20 @@ class AnalyticsService:
         if cached_trends is not None:
             return cached_trends
         
-        # Get all analyses for user's resumes
+        # Get all analyses for user's resumes, with the trailing moving average
+        # computed by the database in the same scan (window function)
+        chronological = (F('analysis_timestamp').asc(), F('id').asc())
         analyses = ResumeAnalysis.objects.filter(
             resume__user=user
-        ).order_by('analysis_timestamp').values_list('final_score', 'analysis_timestamp')
+        ).annotate(
+            moving_avg=Window(
+                expression=Avg('final_score'),
+                order_by=chronological,
+                frame=RowRange(start=-(window_size - 1), end=0),
+            )
+        ).order_by(*chronological).values_list(
+            'final_score', 'analysis_timestamp', 'moving_avg'
+        )
         
         if not analyses:
             return {
@@ -159,11 +227,9 @@ class AnalyticsService:
                 'trend': 'no_data'
             }
         
-        scores = [score for score, _ in analyses]
-        timestamps = [ts.isoformat() for _, ts in analyses]
-        
-        # Calculate moving average
-        moving_avg = AnalyticsService._calculate_moving_average(scores, window_size)
+        scores = [score for score, _, _ in analyses]
+        timestamps = [ts.isoformat() for _, ts, _ in analyses]
+        moving_avg = [round(avg, 2) for _, _, avg in analyses]
         
         # Calculate improvement rate
         if len(scores) >= 2:
@@ -192,30 +258,6 @@ class AnalyticsService:
         
         return result
     
-    @staticmethod
-    def _calculate_moving_average(scores: List[float], window_size: int) -> List[float]:
-        """
-        Calculate moving average for a list of scores.
-        
-        Args:
-            scores: List of scores
-            window_size: Window size for averaging
-            
-        Returns:
-            List[float]: Moving average values
-        """
-        if not scores:
-            return []
-        
-        moving_avg = []
-        for i in range(len(scores)):
-            start_idx = max(0, i - window_size + 1)
-            window = scores[start_idx:i + 1]
-            avg = sum(window) / len(window)
-            moving_avg.append(round(avg, 2))
-        
-        return moving_avg
-    
     @staticmethod
     def get_top_missing_keywords(user: User, limit: int = 10) -> List[Tuple[str, int]]:
         """
@@ -228,23 +270,28 @@ class AnalyticsService:
         Returns:
             List[Tuple[str, int]]: List of (keyword, frequency) tuples
         """
-        # Get all analyses for user's resumes
-        analyses = ResumeAnalysis.objects.filter(resume__user=user)
-        
-        # Aggregate missing keywords
-        keyword_counts = {}
-        for analysis in analyses:
-            for keyword in analysis.missing_keywords:
-                keyword_counts[keyword] = keyword_counts.get(keyword, 0) + 1
-        
-        # Sort by frequency and return top N
-        top_keywords = sorted(
-            keyword_counts.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )[:limit]
-        
-        return top_keywords
+        # Unnest and count the JSON keyword arrays in the database so only the
+        # top N rows come back instead of every analysis
+        sql = _TOP_MISSING_KEYWORDS_SQL.get(connection.vendor)
+        if sql is not None:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    sql.format(
+                        analysis_table=ResumeAnalysis._meta.db_table,
+                        resume_table=Resume._meta.db_table,
+                    ),
+                    [user.id, limit],
+                )
+                return [(keyword, count) for keyword, count in cursor.fetchall()]
+        
+        # Other backends: fetch only the keyword column and count in Python
+        keyword_lists = ResumeAnalysis.objects.filter(
+            resume__user=user
+        ).values_list('missing_keywords', flat=True)
+        keyword_counts = Counter(
+            keyword for keywords in keyword_lists for keyword in keywords
+        )
+        return keyword_counts.most_common(limit)
     
     @staticmethod
     def generate_improvement_report(user: User) -> Dict:
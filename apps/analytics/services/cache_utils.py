@@ -52,13 +52,17 @@ def get_score_trends_cache_key(user_id):
     return f'score_trends_{user_id}'
 
 
-def cache_resume_health(resume_id, health_score):
+def cache_resume_health(resume_id, health_score, fingerprint=None):
     """
     Cache resume health score.
     
+    The score is stored together with the resume content fingerprint it was
+    computed from, so a later lookup with a different fingerprint misses.
+    
     Args:
         resume_id: ID of the resume
         health_score: Health score to cache
+        fingerprint: Optional content fingerprint of the resume
         
     Returns:
         bool: True if cached successfully
@@ -67,7 +71,7 @@ def cache_resume_health(resume_id, health_score):
     timeout = getattr(settings, 'CACHE_TIMEOUT_RESUME_HEALTH', 300)
     
     try:
-        cache.set(cache_key, health_score, timeout)
+        cache.set(cache_key, (fingerprint, health_score), timeout)
         logger.debug(f'Cached resume health for resume {resume_id}: {health_score}')
         return True
     except Exception as e:
@@ -75,22 +79,28 @@ def cache_resume_health(resume_id, health_score):
         return False
 
 
-def get_cached_resume_health(resume_id):
+def get_cached_resume_health(resume_id, fingerprint=None):
     """
     Get cached resume health score.
     
     Args:
         resume_id: ID of the resume
+        fingerprint: Optional content fingerprint the cached score must match
         
     Returns:
-        float or None: Cached health score, or None if not cached
+        float or None: Cached health score, or None if not cached or stale
     """
     cache_key = get_resume_health_cache_key(resume_id)
     
     try:
-        health_score = cache.get(cache_key)
-        if health_score is not None:
-            logger.debug(f'Cache hit for resume health: resume {resume_id}')
+        cached = cache.get(cache_key)
+        if cached is None:
+            return None
+        cached_fingerprint, health_score = cached
+        if cached_fingerprint != fingerprint:
+            logger.debug(f'Stale resume health cache for resume {resume_id}')
+            return None
+        logger.debug(f'Cache hit for resume health: resume {resume_id}')
         return health_score
     except Exception as e:
         logger.error(f'Failed to get cached resume health for resume {resume_id}: {e}')
@@ -117,6 +117,35 @@ class AnalyticsServiceTest(TestCase):
             self.assertGreaterEqual(health, 0, f"Health score {health} is below 0")
             self.assertLessEqual(health, 100, f"Health score {health} is above 100")
     
+    def test_calculate_resume_health_recomputes_after_content_change(self):
+        """Test that cached health is not reused once resume sections change"""
+        bare = Resume.objects.create(
+            user=self.user,
+            title='Bare Resume',
+            template='professional'
+        )
+        
+        before = AnalyticsService.calculate_resume_health(bare)
+        self.assertEqual(AnalyticsService.calculate_resume_health(bare), before)
+        
+        Skill.objects.create(resume=bare, name='Django', category='Framework')
+        
+        after = AnalyticsService.calculate_resume_health(bare)
+        self.assertGreater(after, before)
+    
+    def test_calculate_resume_health_recomputes_after_in_place_edit(self):
+        """Test that editing a section row in place invalidates cached health"""
+        before = AnalyticsService.calculate_resume_health(self.resume)
+        
+        # Same row, same updated_at on the resume -- as the optimizer apply flow does
+        self.experience.description = (
+            'Increased revenue by 30%\nReduced costs by 20%\nLed team of 5 developers'
+        )
+        self.experience.save(update_fields=['description'])
+        
+        after = AnalyticsService.calculate_resume_health(self.resume)
+        self.assertGreater(after, before)
+    
     def test_get_score_trends_no_data(self):
         """Test score trends with no analyses"""
         trends = AnalyticsService.get_score_trends(self.user)
@@ -324,9 +353,22 @@ class AnalyticsServiceTest(TestCase):
         self.assertEqual(report['average_improvement'], 15.0)
     
     def test_moving_average_calculation(self):
-        """Test moving average calculation"""
+        """Test moving average calculation in score trends"""
         scores = [60.0, 65.0, 70.0, 75.0, 80.0]
-        moving_avg = AnalyticsService._calculate_moving_average(scores, window_size=3)
+        for score in scores:
+            ResumeAnalysis.objects.create(
+                resume=self.resume,
+                job_description='Test job description',
+                keyword_match_score=score,
+                skill_relevance_score=score,
+                section_completeness_score=score,
+                experience_impact_score=score,
+                quantification_score=score,
+                action_verb_score=score,
+                final_score=score
+            )
+        
+        moving_avg = AnalyticsService.get_score_trends(self.user, window_size=3)['moving_average']
         
         self.assertEqual(len(moving_avg), len(scores))
         
@@ -338,8 +380,11 @@ class AnalyticsServiceTest(TestCase):
         
         # Third value should be average of first three
         self.assertEqual(moving_avg[2], 65.0)
+        
+        # Later values should only average the trailing window
+        self.assertEqual(moving_avg[4], 75.0)
     
     def test_moving_average_empty_list(self):
-        """Test moving average with empty list"""
-        moving_avg = AnalyticsService._calculate_moving_average([], window_size=5)
+        """Test moving average in score trends with no analyses"""
+        moving_avg = AnalyticsService.get_score_trends(self.user, window_size=5)['moving_average']
         self.assertEqual(len(moving_avg), 0)
@@ -267,3 +267,21 @@ class TrendAnalysisServiceTest(TestCase):
         
         self.assertGreater(summary['volatility'], 10)
         self.assertIn('variation', summary['summary'].lower())
+    
+    def test_get_trend_summary_matches_individual_helpers(self):
+        """Test that the summary reports exactly what the individual helpers return"""
+        # Inputs where vectorized accumulation used to drift by 0.0001
+        score_lists = [
+            [45.1, 29.6, 84.0, 41.2, 66.0, 46.51, 49.55, 74.3, 61.0, 17.7, 66.9, 92.0, 50.3, 34.2, 30.14],
+            [46.0, 18.67, 62.4, 79.0, 70.1, 2.77, 23.01, 67.0, 21.88, 66.0, 56.7, 72.53, 94.47, 66.0, 77.67],
+            [60.0, 80.0, 65.0, 85.0, 70.0, 20.0],
+        ]
+        
+        for scores in score_lists:
+            with self.subTest(scores=scores):
+                summary = TrendAnalysisService.get_trend_summary(scores)
+                self.assertEqual(summary['direction'], TrendAnalysisService.identify_trend_direction(scores))
+                self.assertEqual(summary['improvement_rate'], TrendAnalysisService.calculate_improvement_rate(scores))
+                self.assertEqual(summary['volatility'], TrendAnalysisService.calculate_volatility(scores))
+                self.assertEqual(summary['trend_strength'], TrendAnalysisService.calculate_trend_strength(scores))
+                self.assertEqual(summary['anomalies'], TrendAnalysisService.detect_anomalies(scores))
@@ -10,7 +10,7 @@ class ActionVerbAnalyzerService:
     """
     
     # Strong action verbs that demonstrate impact
-    STRONG_ACTION_VERBS = {
+    STRONG_ACTION_VERBS = frozenset({
         'achieved', 'accelerated', 'accomplished', 'delivered', 'developed',
         'engineered', 'established', 'executed', 'generated', 'implemented',
         'improved', 'increased', 'launched', 'led', 'optimized', 'reduced',
@@ -31,17 +31,17 @@ class ActionVerbAnalyzerService:
         'positioned', 'prioritized', 'propelled', 'realized', 'reengineered',
         'refined', 'revitalized', 'scaled', 'secured', 'standardized',
         'strategized', 'synthesized', 'systematized', 'utilized'
-    }
+    })
     
     # Weak verbs that should be replaced
-    WEAK_VERBS = {
+    WEAK_VERBS = frozenset({
         'did', 'made', 'worked', 'helped', 'tried', 'used', 'was', 'were',
         'had', 'got', 'went', 'came', 'saw', 'took', 'gave', 'found',
         'told', 'asked', 'seemed', 'felt', 'became', 'left', 'put',
         'responsible for', 'in charge of', 'tasked with', 'duties included',
         'worked on', 'helped with', 'assisted with', 'involved in',
         'participated in', 'contributed to', 'supported', 'handled'
-    }
+    })
     
     @staticmethod
     def analyze_action_verbs(text: str) -> Dict:
@@ -13,6 +13,7 @@ This gives users actionable insight: "Your resume scores 82 in Greenhouse but
 only 61 in Taleo because of your two-column layout."
 """
 import re
+from itertools import islice
 from typing import Dict, List
 
 
@@ -285,12 +286,12 @@ class ATSSystemSimulator:
         elif match_ratio >= 0.4:
             warnings.append(
                 f"Moderate keyword match ({match_ratio*100:.0f}%). "
-                f"Add: {', '.join(list(missing)[:5])}"
+                f"Add: {', '.join(islice(missing, 5))}"
             )
         else:
             issues.append(
                 f"Low keyword match ({match_ratio*100:.0f}%). "
-                f"Critical missing keywords: {', '.join(list(missing)[:8])}"
+                f"Critical missing keywords: {', '.join(islice(missing, 8))}"
             )
 
         return min(match_ratio * 100, 100)
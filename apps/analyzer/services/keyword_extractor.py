@@ -2,7 +2,8 @@
 import threading
 import logging
 import string
-from typing import Set, Dict
+from functools import lru_cache
+from typing import AbstractSet, Set, Dict, FrozenSet, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -52,19 +53,24 @@ class KeywordExtractorService:
     }
 
     @staticmethod
-    def extract_keywords(text: str, min_length: int = 3) -> Set[str]:
+    @lru_cache(maxsize=256)
+    def extract_keywords(text: str, min_length: int = 3) -> FrozenSet[str]:
         """
         Extract keywords from text using spaCy NLP.
 
+        Results are cached per (text, min_length): a job description is
+        parsed once even though every scorer and the optimizer extract it.
+
         Args:
             text: Input text to extract keywords from
             min_length: Minimum length of keywords to include
 
         Returns:
-            Set of extracted keywords (lowercase)
+            Frozenset of extracted keywords (lowercase). Immutable so callers
+            can intersect/diff results directly and share them safely.
         """
         if not text or not text.strip():
-            return set()
+            return frozenset()
 
         nlp = _get_nlp()
         if not nlp:
@@ -72,10 +78,10 @@ class KeywordExtractorService:
             tokens = text.lower().translate(
                 str.maketrans('', '', string.punctuation)
             ).split()
-            return {
+            return frozenset(
                 t for t in tokens
                 if len(t) >= min_length and t not in KeywordExtractorService.STOP_WORDS
-            }
+            )
 
         doc = nlp(text.lower())
         keywords = set()
@@ -98,16 +104,25 @@ class KeywordExtractorService:
                 if filtered:
                     keywords.add(filtered)
 
-        return {kw for kw in keywords if len(kw) >= min_length}
+        return frozenset(kw for kw in keywords if len(kw) >= min_length)
 
     @staticmethod
-    def calculate_keyword_frequency(text: str) -> Dict[str, int]:
-        """Calculate frequency of each keyword in text."""
+    def calculate_keyword_frequency(text: str, only: Optional[AbstractSet[str]] = None) -> Dict[str, int]:
+        """
+        Calculate frequency of each keyword in text.
+
+        Pass ``only`` when the caller needs just a few keywords' counts; the
+        text is then scanned for those keywords alone instead of for every
+        keyword extracted from it.
+        """
         if not text or not text.strip():
             return {}
         keywords = KeywordExtractorService.extract_keywords(text)
+        if only is not None:
+            keywords = keywords & only
         text_lower = text.lower()
-        return {kw: text_lower.count(kw) for kw in keywords if text_lower.count(kw) > 0}
+        counts = {kw: text_lower.count(kw) for kw in keywords}
+        return {kw: n for kw, n in counts.items() if n > 0}
 
     @staticmethod
     def weight_keywords_by_importance(keywords: Set[str], context: str) -> Dict[str, float]:
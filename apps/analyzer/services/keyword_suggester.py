@@ -181,14 +181,11 @@ class KeywordSuggesterService:
             KeywordSuggesterService.INDUSTRY_KEYWORDS['general']
         )
         
-        # Get current resume keywords
+        # Get current resume and job description keywords
+        # (extract_keywords already returns lowercase frozensets)
         resume_text = KeywordSuggesterService._get_resume_text(resume)
-        resume_keywords = KeywordExtractorService.extract_keywords(resume_text)
-        resume_keywords_lower = {kw.lower() for kw in resume_keywords}
-        
-        # Get job description keywords
-        jd_keywords = KeywordExtractorService.extract_keywords(job_description)
-        jd_keywords_lower = {kw.lower() for kw in jd_keywords}
+        resume_keywords_lower = KeywordExtractorService.extract_keywords(resume_text)
+        jd_keywords_lower = KeywordExtractorService.extract_keywords(job_description)
         
         # Generate suggestions
         suggestions = []
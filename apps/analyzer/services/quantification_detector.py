@@ -19,6 +19,15 @@ class QuantificationDetectorService:
         'time': r'\b\d+\s*(?:year|month|week|day|hour)s?\b',  # 3 years, 6 months
     }
     
+    _COMPILED_PATTERNS = {
+        quant_type: re.compile(pattern, re.IGNORECASE) for quant_type, pattern in PATTERNS.items()
+    }
+    # has_quantification only needs to know whether any pattern matches, so
+    # all of them are fused into one alternation and the text is scanned once
+    _ANY_PATTERN = re.compile(
+        '|'.join(f'(?:{pattern})' for pattern in PATTERNS.values()), re.IGNORECASE
+    )
+    
     @staticmethod
     def detect_quantifications(text: str) -> List[Dict]:
         """
@@ -38,9 +47,8 @@ class QuantificationDetectorService:
         
         quantifications = []
         
-        for quant_type, pattern in QuantificationDetectorService.PATTERNS.items():
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
+        for quant_type, pattern in QuantificationDetectorService._COMPILED_PATTERNS.items():
+            for match in pattern.finditer(text):
                 quantifications.append({
                     'type': quant_type,
                     'value': match.group(),
@@ -66,11 +74,7 @@ class QuantificationDetectorService:
         if not text or not text.strip():
             return False
         
-        for pattern in QuantificationDetectorService.PATTERNS.values():
-            if re.search(pattern, text, re.IGNORECASE):
-                return True
-        
-        return False
+        return QuantificationDetectorService._ANY_PATTERN.search(text) is not None
     
     @staticmethod
     def calculate_quantification_score(text: str) -> float:
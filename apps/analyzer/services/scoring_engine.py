@@ -30,9 +30,28 @@ class _ResumeTextBundle(NamedTuple):
     experiences: list   # raw Experience objects (already fetched)
 
 
-def _build_cache_key(resume_id: int, jd_text: str) -> str:
+def _build_cache_key(resume_id: int, jd_text: str, resume_state: str) -> str:
+    # Keyed on the scored resume content too: section edits save the child rows
+    # in place and never touch Resume.updated_at, so an id-only key went stale
     jd_hash = hashlib.md5(jd_text.encode(), usedforsecurity=False).hexdigest()[:16]
-    return f"ats_score:{resume_id}:{jd_hash}"
+    state_hash = hashlib.md5(resume_state.encode(), usedforsecurity=False).hexdigest()[:16]
+    return f"ats_score:{resume_id}:{jd_hash}:{state_hash}"
+
+
+def _resume_state(resume, bundle: _ResumeTextBundle) -> str:
+    """Everything the sub-scorers read beyond the job description, as one string."""
+    try:
+        pi = resume.personal_info
+        contact = (pi.full_name, pi.email, pi.phone, pi.location)
+    except Exception:
+        contact = None
+    counts = (
+        len(bundle.experiences),
+        len(resume.education.all()),
+        len(resume.skills.all()),
+        len(resume.projects.all()),
+    )
+    return repr((bundle.full_text, bundle.experience_text, contact, counts))
 
 
 def _extract_resume_texts(resume) -> _ResumeTextBundle:
@@ -92,7 +111,7 @@ class ScoringEngineService:
 
     Performance contract:
     - First call for a resume+JD pair: ~200-400ms (spaCy NLP runs once)
-    - Subsequent calls within 10 min: <1ms (Django cache hit)
+    - Subsequent calls within 10 min on unchanged content: <1ms (Django cache hit)
     - DB queries: 0 extra if resume was prefetched by caller
     """
 
@@ -108,19 +127,15 @@ class ScoringEngineService:
     @staticmethod
     def calculate_ats_score(resume, job_description: str) -> Dict:
         """
-        Calculate comprehensive ATS score. Results are cached for 10 minutes.
+        Calculate comprehensive ATS score. Results are cached for 10 minutes,
+        keyed on the job description and the resume's current content, so
+        editing the resume forces a fresh score.
 
         Callers MUST prefetch relations before calling:
             Resume.objects.prefetch_related(
                 'personal_info', 'experiences', 'education', 'skills', 'projects'
             ).get(id=resume_id)
         """
-        # ── Cache check ───────────────────────────────────────────────────────
-        cache_key = _build_cache_key(resume.id, job_description)
-        cached = cache.get(cache_key)
-        if cached is not None:
-            return cached
-
         # ── Ensure prefetch (defensive — avoids N+1 if caller forgot) ────────
         from django.db.models import prefetch_related_objects
         prefetch_related_objects(
@@ -131,6 +146,12 @@ class ScoringEngineService:
         # ── Single-pass text extraction ───────────────────────────────────────
         bundle = _extract_resume_texts(resume)
 
+        # ── Cache check (keyed on JD + current resume content) ────────────────
+        cache_key = _build_cache_key(resume.id, job_description, _resume_state(resume, bundle))
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         # ── Single-pass keyword extraction (NLP runs ONCE per text) ──────────
         resume_kw: Set[str] = KeywordExtractorService.extract_keywords(bundle.full_text)
         jd_kw: Set[str] = KeywordExtractorService.extract_keywords(job_description)
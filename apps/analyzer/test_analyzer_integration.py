@@ -8,7 +8,7 @@ Tests the complete ATS analysis workflow including:
 - Suggestion generation
 """
 
-from django.test import TestCase, Client
+from django.test import TestCase
 from django.contrib.auth.models import User
 from apps.resumes.models import Resume, PersonalInfo, Experience, Education, Skill, Project
 from apps.analyzer.services import ATSAnalyzerService
@@ -18,23 +18,24 @@ from apps.analyzer.forms import JobDescriptionForm
 class ATSAnalyzerServiceTests(TestCase):
     """Test the ATSAnalyzerService methods."""
     
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data."""
-        self.user = User.objects.create_user(
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpass123'
         )
         
-        self.resume = Resume.objects.create(
-            user=self.user,
+        cls.resume = Resume.objects.create(
+            user=cls.user,
             title='Test Resume',
             template='professional'
         )
         
         # Add personal info
         PersonalInfo.objects.create(
-            resume=self.resume,
+            resume=cls.resume,
             full_name='John Doe',
             phone='555-1234',
             email='john@example.com',
@@ -43,7 +44,7 @@ class ATSAnalyzerServiceTests(TestCase):
         
         # Add experience
         Experience.objects.create(
-            resume=self.resume,
+            resume=cls.resume,
             company='Tech Corp',
             role='Software Engineer',
             start_date='2020-01-01',
@@ -52,7 +53,7 @@ class ATSAnalyzerServiceTests(TestCase):
         
         # Add education
         Education.objects.create(
-            resume=self.resume,
+            resume=cls.resume,
             institution='University of California',
             degree='Bachelor of Science',
             field='Computer Science',
@@ -61,13 +62,14 @@ class ATSAnalyzerServiceTests(TestCase):
         )
         
         # Add skills
-        Skill.objects.create(resume=self.resume, name='Python', category='Technical')
-        Skill.objects.create(resume=self.resume, name='Django', category='Technical')
-        Skill.objects.create(resume=self.resume, name='JavaScript', category='Technical')
+        Skill.objects.bulk_create([
+            Skill(resume=cls.resume, name=name, category='Technical')
+            for name in ('Python', 'Django', 'JavaScript')
+        ])
         
         # Add project
         Project.objects.create(
-            resume=self.resume,
+            resume=cls.resume,
             name='E-commerce Platform',
             description='Built a full-stack e-commerce platform using React and Node.js',
             technologies='React, Node.js, MongoDB'
@@ -259,32 +261,34 @@ class JobDescriptionFormTests(TestCase):
 class AnalyzerViewTests(TestCase):
     """Test the analyzer views."""
     
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data."""
-        self.client = Client()
-        self.user = User.objects.create_user(
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpass123'
         )
         
-        self.resume = Resume.objects.create(
-            user=self.user,
+        cls.resume = Resume.objects.create(
+            user=cls.user,
             title='Test Resume',
             template='professional'
         )
         
         # Add minimal data for analysis
         PersonalInfo.objects.create(
-            resume=self.resume,
+            resume=cls.resume,
             full_name='John Doe',
             phone='555-1234',
             email='john@example.com',
             location='San Francisco, CA'
         )
         
-        Skill.objects.create(resume=self.resume, name='Python', category='Technical')
-        Skill.objects.create(resume=self.resume, name='Django', category='Technical')
+        Skill.objects.bulk_create([
+            Skill(resume=cls.resume, name=name, category='Technical')
+            for name in ('Python', 'Django')
+        ])
     
     def test_analyze_view_requires_login(self):
         """Test that analyze view requires authentication."""
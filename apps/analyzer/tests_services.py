@@ -1,7 +1,10 @@
 """
 Unit tests for analyzer services
 """
+from datetime import date
 from django.test import TestCase
+from django.contrib.auth.models import User
+from apps.resumes.models import Resume, Experience, PersonalInfo
 from apps.analyzer.services import (
     KeywordExtractorService,
     ActionVerbAnalyzerService,
@@ -18,7 +21,7 @@ class KeywordExtractorServiceTest(TestCase):
         text = "Python developer with Django experience"
         keywords = KeywordExtractorService.extract_keywords(text)
         
-        self.assertIsInstance(keywords, set)
+        self.assertIsInstance(keywords, frozenset)
         self.assertGreater(len(keywords), 0)
         self.assertIn('python', keywords)
         self.assertIn('django', keywords)
@@ -46,6 +49,15 @@ class KeywordExtractorServiceTest(TestCase):
         self.assertIn('python', freq)
         self.assertEqual(freq['python'], 3)
     
+    def test_calculate_keyword_frequency_only(self):
+        """Test frequency calculation restricted to requested keywords"""
+        text = "Python Python Django Python"
+        freq = KeywordExtractorService.calculate_keyword_frequency(
+            text, only={'python', 'kubernetes'}
+        )
+        
+        self.assertEqual(freq, {'python': 3})
+    
     def test_weight_keywords_by_importance(self):
         """Test keyword weighting"""
         keywords = {'python', 'django', 'javascript'}
@@ -147,6 +159,19 @@ class QuantificationDetectorServiceTest(TestCase):
 class ScoringEngineServiceTest(TestCase):
     """Tests for ScoringEngineService"""
     
+    @classmethod
+    def setUpTestData(cls):
+        """Resume with personal info only and empty sections"""
+        user = User.objects.create_user(username='bounds', password='testpass123')
+        cls.resume = Resume.objects.create(user=user, title='Bounds Resume')
+        PersonalInfo.objects.create(
+            resume=cls.resume,
+            full_name="Test",
+            email="test@test.com",
+            phone="123",
+            location="City"
+        )
+    
     def test_calculate_keyword_match_score(self):
         """Test keyword match score calculation"""
         resume_text = "Python Django PostgreSQL developer"
@@ -178,33 +203,7 @@ class ScoringEngineServiceTest(TestCase):
     
     def test_score_bounds(self):
         """Test that all scores are within 0-100 range"""
-        # Create mock resume
-        class MockResume:
-            class personal_info:
-                full_name = "Test"
-                email = "test@test.com"
-                phone = "123"
-                location = "City"
-            
-            class MockQuerySet:
-                def __init__(self, items):
-                    self._items = items
-                
-                def all(self):
-                    return self._items
-                
-                def exists(self):
-                    return len(self._items) > 0
-                
-                def count(self):
-                    return len(self._items)
-            
-            experiences = MockQuerySet([])
-            education = MockQuerySet([])
-            skills = MockQuerySet([])
-            projects = MockQuerySet([])
-        
-        resume = MockResume()
+        resume = Resume.objects.get(id=self.resume.id)
         jd = "Python developer"
         
         result = ScoringEngineService.calculate_ats_score(resume, jd)
@@ -216,3 +215,28 @@ class ScoringEngineServiceTest(TestCase):
         self.assertLessEqual(result['keyword_match_score'], 100)
         self.assertGreaterEqual(result['skill_relevance_score'], 0)
         self.assertLessEqual(result['skill_relevance_score'], 100)
+    
+    def test_calculate_ats_score_rescores_after_in_place_edit(self):
+        """Test cached scores are not reused once the resume content changes"""
+        user = User.objects.create_user(username='scorer', password='testpass123')
+        resume = Resume.objects.create(user=user, title='Scored Resume')
+        experience = Experience.objects.create(
+            resume=resume,
+            company='Acme',
+            role='Developer',
+            start_date=date(2020, 1, 1),
+            description='Wrote Java services'
+        )
+        jd = "Python developer with Django experience"
+        
+        before = ScoringEngineService.calculate_ats_score(Resume.objects.get(id=resume.id), jd)
+        
+        # Edit the section in place, as the experience edit view does
+        # (Resume.updated_at is left untouched)
+        experience.description = 'Built Python and Django services'
+        experience.save()
+        
+        after = ScoringEngineService.calculate_ats_score(Resume.objects.get(id=resume.id), jd)
+        
+        self.assertNotIn('python', before['matched_keywords'])
+        self.assertIn('python', after['matched_keywords'])
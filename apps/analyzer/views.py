@@ -96,8 +96,9 @@ def analyze_resume(request, resume_id):
                         from django.utils import timezone
                         ResumeAnalysis.objects.update_or_create(
                             resume=resume,
-                            job_description=job_description,
+                            job_description_hash=ResumeAnalysis.hash_job_description(job_description),
                             defaults={
+                                'job_description': job_description,
                                 'keyword_match_score': analysis_result['score'],
                                 'skill_relevance_score': analysis_result['score'],
                                 'section_completeness_score': analysis_result['score'],
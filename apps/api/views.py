@@ -18,6 +18,7 @@ Endpoints:
 """
 import logging
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
 from rest_framework import viewsets, status, generics
 from rest_framework.decorators import action, api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated, AllowAny
@@ -110,7 +111,6 @@ class ResumeViewSet(viewsets.ModelViewSet):
             # Celery not available — run synchronously
             from apps.analyzer.services.scoring_engine import ScoringEngineService
             from apps.resumes.services.llm_service import LLMService
-            from django.utils import timezone
 
             score_data = ScoringEngineService.calculate_ats_score(resume, job_description)
             explanation = LLMService.explain_ats_score(score_data, resume.title)
@@ -252,14 +252,18 @@ def dashboard(request):
     average_score = None
     score_breakdown = None
 
-    if resumes.exists():
-        latest_resume = resumes.first()
+    # first() doubles as the existence probe: one query instead of EXISTS + SELECT
+    latest_resume = resumes.first()
+    has_resumes = latest_resume is not None
+
+    if has_resumes:
         resume_health = AnalyticsService.calculate_resume_health(latest_resume)
 
         analyses_qs = ResumeAnalysis.objects.filter(resume__user=request.user)
-        if analyses_qs.exists():
-            agg = analyses_qs.aggregate(Avg('final_score'))
-            average_score = round(agg['final_score__avg'], 1) if agg['final_score__avg'] else None
+        agg = analyses_qs.aggregate(Avg('final_score'))
+        # AVG is NULL when the user has no analyses, so no separate exists() probe
+        if agg['final_score__avg'] is not None:
+            average_score = round(agg['final_score__avg'], 1)
 
             # Latest analysis breakdown for radar/bar chart
             latest_analysis = analyses_qs.order_by('-analysis_timestamp').first()
@@ -313,17 +317,20 @@ def dashboard(request):
     show_charts = False
     chart_data_json = None
 
-    if resumes.exists():
-        analyses = ResumeAnalysis.objects.filter(
-            resume__user=request.user
-        ).order_by('analysis_timestamp')[:12]
+    if has_resumes:
+        # Fetch the chart points once; an empty list means nothing to plot
+        trend_points = list(
+            ResumeAnalysis.objects.filter(resume__user=request.user)
+            .order_by('analysis_timestamp')
+            .values_list('analysis_timestamp', 'final_score')[:12]
+        )
 
-        if analyses.count() >= 1:
+        if trend_points:
             show_charts = True
             chart_data_json = json.dumps({
                 'score_trend': {
-                    'labels': [a.analysis_timestamp.strftime('%b %d') for a in analyses],
-                    'scores': [float(a.final_score) for a in analyses],
+                    'labels': [ts.strftime('%b %d') for ts, _ in trend_points],
+                    'scores': [float(score) for _, score in trend_points],
                 },
                 'breakdown': score_breakdown or {},
             })
@@ -341,7 +348,7 @@ def dashboard(request):
         'show_charts': show_charts,
         'chart_data_json': chart_data_json,
         'current_date': timezone.now(),
-        'is_new_user': not resumes.exists(),
+        'is_new_user': not has_resumes,
     }
     return render(request, 'authentication/dashboard_new.html', context)
 
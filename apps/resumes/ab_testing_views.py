@@ -24,7 +24,8 @@ def ab_test_list(request):
 @login_required
 def ab_test_create(request):
     """Create a new A/B test."""
-    resumes = Resume.objects.filter(user=request.user)
+    # The picker only renders pk/title; skip the summary and other columns
+    resumes = Resume.objects.filter(user=request.user).only('id', 'title')
 
     if request.method == 'POST':
         name = request.POST.get('name', '').strip()
@@ -9,6 +9,16 @@ import bleach
 from .models import Resume, PersonalInfo, Experience, Education, Skill, Project
 
 
+def _control(widget_class, placeholder, css_class='form-control', **attrs):
+    """Build a Bootstrap-styled input widget with a placeholder."""
+    return widget_class(attrs={'class': css_class, 'placeholder': placeholder, **attrs})
+
+
+def _date_control(placeholder):
+    """Build a native date picker widget."""
+    return _control(forms.DateInput, placeholder, css_class='form-control datepicker', type='date')
+
+
 class ResumeForm(forms.ModelForm):
     """Form for resume title and template selection."""
     
@@ -32,7 +42,7 @@ class ResumeForm(forms.ModelForm):
         model = Resume
         fields = ['title', 'template']
         widgets = {
-            'title': forms.TextInput(attrs={'class': 'form-control', 'placeholder': 'e.g., Software Engineer Resume'}),
+            'title': _control(forms.TextInput, 'e.g., Software Engineer Resume'),
         }
     
     def __init__(self, *args, **kwargs):
@@ -66,12 +76,12 @@ class PersonalInfoForm(forms.ModelForm):
         model = PersonalInfo
         fields = ['full_name', 'phone', 'email', 'linkedin', 'github', 'location']
         widgets = {
-            'full_name': forms.TextInput(attrs={'class': 'form-control', 'placeholder': 'John Doe'}),
-            'phone': forms.TextInput(attrs={'class': 'form-control', 'placeholder': '+1 (555) 123-4567'}),
-            'email': forms.EmailInput(attrs={'class': 'form-control', 'placeholder': 'john.doe@example.com'}),
-            'linkedin': forms.URLInput(attrs={'class': 'form-control', 'placeholder': 'https://linkedin.com/in/johndoe'}),
-            'github': forms.URLInput(attrs={'class': 'form-control', 'placeholder': 'https://github.com/johndoe'}),
-            'location': forms.TextInput(attrs={'class': 'form-control', 'placeholder': 'San Francisco, CA'})
+            'full_name': _control(forms.TextInput, 'John Doe'),
+            'phone': _control(forms.TextInput, '+1 (555) 123-4567'),
+            'email': _control(forms.EmailInput, 'john.doe@example.com'),
+            'linkedin': _control(forms.URLInput, 'https://linkedin.com/in/johndoe'),
+            'github': _control(forms.URLInput, 'https://github.com/johndoe'),
+            'location': _control(forms.TextInput, 'San Francisco, CA')
         }
     
     def __init__(self, *args, **kwargs):
@@ -145,38 +155,19 @@ class ExperienceForm(forms.ModelForm):
         model = Experience
         fields = ['company', 'role', 'location', 'start_date', 'end_date', 'description', 'achievements']
         widgets = {
-            'company': forms.TextInput(attrs={
-                'class': 'form-control', 
-                'placeholder': 'Company Name'
-            }),
-            'role': forms.TextInput(attrs={
-                'class': 'form-control', 
-                'placeholder': 'Job Title (e.g., Senior Software Engineer)'
-            }),
-            'location': forms.TextInput(attrs={
-                'class': 'form-control', 
-                'placeholder': 'City, State/Country (e.g., San Francisco, CA)'
-            }),
-            'start_date': forms.DateInput(attrs={
-                'class': 'form-control datepicker',
-                'type': 'date',
-                'placeholder': 'Select start date',
-            }),
-            'end_date': forms.DateInput(attrs={
-                'class': 'form-control datepicker',
-                'type': 'date',
-                'placeholder': 'Select end date',
-            }),
-            'description': forms.Textarea(attrs={
-                'class': 'form-control', 
-                'rows': 3, 
-                'placeholder': 'Brief overview of your role and responsibilities...'
-            }),
-            'achievements': forms.Textarea(attrs={
-                'class': 'form-control', 
-                'rows': 6, 
-                'placeholder': '• Developed and deployed 5+ full-stack applications serving 10,000+ users\n• Improved application performance by 40% through database optimization\n• Led code reviews and mentored 3 junior developers\n• Implemented RESTful APIs handling 1M+ requests daily'
-            })
+            'company': _control(forms.TextInput, 'Company Name'),
+            'role': _control(forms.TextInput, 'Job Title (e.g., Senior Software Engineer)'),
+            'location': _control(forms.TextInput, 'City, State/Country (e.g., San Francisco, CA)'),
+            'start_date': _date_control('Select start date'),
+            'end_date': _date_control('Select end date'),
+            'description': _control(
+                forms.Textarea, 'Brief overview of your role and responsibilities...', rows=3
+            ),
+            'achievements': _control(
+                forms.Textarea,
+                '• Developed and deployed 5+ full-stack applications serving 10,000+ users\n• Improved application performance by 40% through database optimization\n• Led code reviews and mentored 3 junior developers\n• Implemented RESTful APIs handling 1M+ requests daily',
+                rows=6,
+            )
         }
         help_texts = {
             'achievements': 'List your key achievements with quantifiable metrics (one per line, start with action verbs like Developed, Implemented, Led, Optimized)'
@@ -254,42 +245,18 @@ class EducationForm(forms.ModelForm):
         model = Education
         fields = ['institution', 'degree', 'field', 'start_year', 'end_year', 'gpa', 'honors', 'relevant_coursework']
         widgets = {
-            'institution': forms.TextInput(attrs={
-                'class': 'form-control', 
-                'placeholder': 'University Name'
-            }),
-            'degree': forms.TextInput(attrs={
-                'class': 'form-control', 
-                'placeholder': 'Bachelor of Science'
-            }),
-            'field': forms.TextInput(attrs={
-                'class': 'form-control', 
-                'placeholder': 'Computer Science'
-            }),
-            'start_year': forms.NumberInput(attrs={
-                'class': 'form-control', 
-                'placeholder': '2018'
-            }),
-            'end_year': forms.NumberInput(attrs={
-                'class': 'form-control', 
-                'placeholder': '2022'
-            }),
-            'gpa': forms.NumberInput(attrs={
-                'class': 'form-control', 
-                'placeholder': '3.8',
-                'step': '0.01',
-                'min': '0',
-                'max': '4.0'
-            }),
-            'honors': forms.TextInput(attrs={
-                'class': 'form-control', 
-                'placeholder': 'Summa Cum Laude, Dean\'s List'
-            }),
-            'relevant_coursework': forms.Textarea(attrs={
-                'class': 'form-control', 
-                'rows': 2, 
-                'placeholder': 'Data Structures, Algorithms, Machine Learning, Database Systems'
-            })
+            'institution': _control(forms.TextInput, 'University Name'),
+            'degree': _control(forms.TextInput, 'Bachelor of Science'),
+            'field': _control(forms.TextInput, 'Computer Science'),
+            'start_year': _control(forms.NumberInput, '2018'),
+            'end_year': _control(forms.NumberInput, '2022'),
+            'gpa': _control(forms.NumberInput, '3.8', step='0.01', min='0', max='4.0'),
+            'honors': _control(forms.TextInput, 'Summa Cum Laude, Dean\'s List'),
+            'relevant_coursework': _control(
+                forms.Textarea,
+                'Data Structures, Algorithms, Machine Learning, Database Systems',
+                rows=2,
+            )
         }
         help_texts = {
             'gpa': 'GPA out of 4.0 (optional, only include if 3.5 or higher)',
@@ -423,16 +390,8 @@ class SkillForm(forms.ModelForm):
         model = Skill
         fields = ['name', 'category', 'proficiency_level', 'years_of_experience']
         widgets = {
-            'name': forms.TextInput(attrs={
-                'class': 'form-control', 
-                'placeholder': 'e.g., Python, React, AWS, Leadership'
-            }),
-            'years_of_experience': forms.NumberInput(attrs={
-                'class': 'form-control', 
-                'placeholder': '3',
-                'min': '0',
-                'max': '50'
-            })
+            'name': _control(forms.TextInput, 'e.g., Python, React, AWS, Leadership'),
+            'years_of_experience': _control(forms.NumberInput, '3', min='0', max='50')
         }
         help_texts = {
             'proficiency_level': 'Your skill level (optional)',
@@ -487,38 +446,23 @@ class ProjectForm(forms.ModelForm):
         model = Project
         fields = ['name', 'description', 'technologies', 'impact', 'url', 'start_date', 'end_date']
         widgets = {
-            'name': forms.TextInput(attrs={
-                'class': 'form-control', 
-                'placeholder': 'Project Name'
-            }),
-            'description': forms.Textarea(attrs={
-                'class': 'form-control', 
-                'rows': 3, 
-                'placeholder': 'Describe the project, your role, and what problem it solves...'
-            }),
-            'technologies': forms.TextInput(attrs={
-                'class': 'form-control', 
-                'placeholder': 'Python, Django, PostgreSQL, React, AWS'
-            }),
-            'impact': forms.Textarea(attrs={
-                'class': 'form-control', 
-                'rows': 2, 
-                'placeholder': 'Achieved 95% ATS compatibility score, Serving 10,000+ users, Reduced processing time by 40%'
-            }),
-            'url': forms.URLInput(attrs={
-                'class': 'form-control', 
-                'placeholder': 'https://github.com/username/project or https://project-demo.com'
-            }),
-            'start_date': forms.DateInput(attrs={
-                'class': 'form-control datepicker',
-                'type': 'date',
-                'placeholder': 'Select start date',
-            }),
-            'end_date': forms.DateInput(attrs={
-                'class': 'form-control datepicker',
-                'type': 'date',
-                'placeholder': 'Select end date',
-            })
+            'name': _control(forms.TextInput, 'Project Name'),
+            'description': _control(
+                forms.Textarea,
+                'Describe the project, your role, and what problem it solves...',
+                rows=3,
+            ),
+            'technologies': _control(forms.TextInput, 'Python, Django, PostgreSQL, React, AWS'),
+            'impact': _control(
+                forms.Textarea,
+                'Achieved 95% ATS compatibility score, Serving 10,000+ users, Reduced processing time by 40%',
+                rows=2,
+            ),
+            'url': _control(
+                forms.URLInput, 'https://github.com/username/project or https://project-demo.com'
+            ),
+            'start_date': _date_control('Select start date'),
+            'end_date': _date_control('Select end date')
         }
         help_texts = {
             'impact': 'Quantifiable results or achievements (optional)',
@@ -11,6 +11,7 @@ import random
 from datetime import date, timedelta
 from django.core.management.base import BaseCommand
 from django.contrib.auth.models import User
+from django.db import transaction
 from django.utils import timezone
 
 from apps.resumes.models import (
@@ -97,14 +98,26 @@ INSTITUTIONS = [
 ]
 
 SKILL_SETS = {
-    "Languages":   ["Python", "JavaScript", "TypeScript", "Go", "Java", "Rust", "SQL", "Bash"],
-    "Frameworks":  ["Django", "React", "Node.js", "FastAPI", "Spring Boot", "Next.js", "Vue.js"],
-    "Tools":       ["Docker", "Kubernetes", "Terraform", "Git", "Jenkins", "GitHub Actions", "Ansible"],
-    "Databases":   ["PostgreSQL", "MySQL", "MongoDB", "Redis", "Elasticsearch", "DynamoDB"],
-    "Cloud":       ["AWS", "GCP", "Azure", "Heroku", "Vercel"],
-    "Soft Skills": ["Leadership", "Communication", "Problem Solving", "Agile", "Mentoring"],
+    "Languages":   ("Python", "JavaScript", "TypeScript", "Go", "Java", "Rust", "SQL", "Bash"),
+    "Frameworks":  ("Django", "React", "Node.js", "FastAPI", "Spring Boot", "Next.js", "Vue.js"),
+    "Tools":       ("Docker", "Kubernetes", "Terraform", "Git", "Jenkins", "GitHub Actions", "Ansible"),
+    "Databases":   ("PostgreSQL", "MySQL", "MongoDB", "Redis", "Elasticsearch", "DynamoDB"),
+    "Cloud":       ("AWS", "GCP", "Azure", "Heroku", "Vercel"),
+    "Soft Skills": ("Leadership", "Communication", "Problem Solving", "Agile", "Mentoring"),
 }
 
+PROFICIENCY_LEVELS = ("beginner", "intermediate", "advanced", "expert")
+VERSION_MODIFICATION_TYPES = ("manual", "optimized", "restored")
+
+MATCHED_KEYWORD_POOL = ("Python", "Django", "REST API", "PostgreSQL", "Docker", "AWS", "CI/CD")
+MISSING_KEYWORD_POOL = ("Kubernetes", "Terraform", "Go", "GraphQL", "Redis")
+WEAK_ACTION_VERBS = ("worked on", "helped with", "was responsible for")
+ANALYSIS_SUGGESTIONS = (
+    "Add quantifiable metrics to your experience bullet points.",
+    "Include more industry-specific keywords from the job description.",
+    "Strengthen action verbs — replace 'worked on' with 'engineered' or 'architected'.",
+)
+
 PROJECTS = [
     {
         "name": "OpenResume",
@@ -258,19 +271,22 @@ class Command(BaseCommand):
         )
 
     def handle(self, *args, **options):
-        if options["flush"]:
-            self._flush()
-
-        num_users = min(options["users"], len(USERS))
-        self.stdout.write(self.style.MIGRATE_HEADING(f"\n🌱  Seeding mock data for {num_users} user(s)...\n"))
-
-        for user_data in USERS[:num_users]:
-            user = self._create_user(user_data)
-            resumes = self._create_resumes(user)
-            self._create_saved_job_descriptions(user)
-            self._create_job_applications(user, resumes)
-            self._create_activity_logs(user, resumes)
-            self._create_skill_gap_analysis(user, resumes)
+        # One transaction for the whole run: a single commit instead of one
+        # per INSERT, and a failed seed leaves no partial data behind.
+        with transaction.atomic():
+            if options["flush"]:
+                self._flush()
+
+            num_users = min(options["users"], len(USERS))
+            self.stdout.write(self.style.MIGRATE_HEADING(f"\n🌱  Seeding mock data for {num_users} user(s)...\n"))
+
+            for user_data in USERS[:num_users]:
+                user = self._create_user(user_data)
+                resumes = self._create_resumes(user)
+                self._create_saved_job_descriptions(user)
+                self._create_job_applications(user, resumes)
+                self._create_activity_logs(user, resumes)
+                self._create_skill_gap_analysis(user, resumes)
 
         self.stdout.write(self.style.SUCCESS("\n✅  Mock data seeded successfully!\n"))
         self.stdout.write("   Demo credentials  →  username: alex_johnson  |  password: mockpass123\n")
@@ -314,6 +330,7 @@ class Command(BaseCommand):
 
     def _create_resumes(self, user: User) -> list:
         resumes = []
+        analyses = []
         resume_titles = [
             f"{user.first_name} {user.last_name} — Software Engineer",
             f"{user.first_name} {user.last_name} — Senior Developer",
@@ -343,11 +360,14 @@ class Command(BaseCommand):
             self._create_projects(resume)
             self._create_certifications(resume)
             self._create_resume_versions(resume)
-            self._create_resume_analyses(resume)
+            analyses.append(self._build_resume_analysis(resume))
 
             resumes.append(resume)
             self.stdout.write(f"    📄  Resume: {resume.title}")
 
+        # Insert every sample analysis for this user in one statement
+        ResumeAnalysis.objects.bulk_create(analyses, batch_size=500)
+
         return resumes
 
     def _create_personal_info(self, resume: Resume, user: User):
@@ -402,19 +422,19 @@ class Command(BaseCommand):
             )
 
     def _create_skills(self, resume: Resume):
-        proficiency_levels = ["beginner", "intermediate", "advanced", "expert"]
+        skills = []
         for category, skill_list in SKILL_SETS.items():
             selected = random.sample(skill_list, k=random.randint(2, min(4, len(skill_list))))
             for skill_name in selected:
-                Skill.objects.get_or_create(
+                skills.append(Skill(
                     resume=resume,
                     name=skill_name,
-                    defaults={
-                        "category": category,
-                        "proficiency_level": random.choice(proficiency_levels),
-                        "years_of_experience": random.randint(1, 7),
-                    },
-                )
+                    category=category,
+                    proficiency_level=random.choice(PROFICIENCY_LEVELS),
+                    years_of_experience=random.randint(1, 7),
+                ))
+        # One multi-row INSERT; (resume, name) is unique so existing skills are left untouched
+        Skill.objects.bulk_create(skills, ignore_conflicts=True, batch_size=500)
 
     def _create_projects(self, resume: Resume):
         selected = random.sample(PROJECTS, k=random.randint(2, len(PROJECTS)))
@@ -449,7 +469,6 @@ class Command(BaseCommand):
             )
 
     def _create_resume_versions(self, resume: Resume):
-        mod_types = ["manual", "optimized", "restored"]
         for v in range(1, resume.current_version_number + 1):
             snapshot = {
                 "title": resume.title,
@@ -462,25 +481,21 @@ class Command(BaseCommand):
             ResumeVersion.objects.create(
                 resume=resume,
                 version_number=v,
-                modification_type=random.choice(mod_types),
+                modification_type=random.choice(VERSION_MODIFICATION_TYPES),
                 ats_score=round(random.uniform(50, 95), 1),
                 snapshot_data=snapshot,
                 user_notes=f"Version {v} snapshot" if v > 1 else "Initial version",
             )
 
-    def _create_resume_analyses(self, resume: Resume):
+    def _build_resume_analysis(self, resume: Resume) -> ResumeAnalysis:
         jd = random.choice(JOB_DESCRIPTIONS)
-        matched   = random.sample(["Python", "Django", "REST API", "PostgreSQL", "Docker", "AWS", "CI/CD"], k=4)
-        missing   = random.sample(["Kubernetes", "Terraform", "Go", "GraphQL", "Redis"], k=2)
-        weak_verbs = ["worked on", "helped with", "was responsible for"]
-        suggestions = [
-            "Add quantifiable metrics to your experience bullet points.",
-            "Include more industry-specific keywords from the job description.",
-            "Strengthen action verbs — replace 'worked on' with 'engineered' or 'architected'.",
-        ]
-        ResumeAnalysis.objects.create(
+        matched   = random.sample(MATCHED_KEYWORD_POOL, k=4)
+        missing   = random.sample(MISSING_KEYWORD_POOL, k=2)
+        return ResumeAnalysis(
             resume=resume,
             job_description=jd["content"],
+            # bulk_create skips save(), so set the digest explicitly
+            job_description_hash=ResumeAnalysis.hash_job_description(jd["content"]),
             keyword_match_score=round(random.uniform(55, 90), 1),
             skill_relevance_score=round(random.uniform(60, 95), 1),
             section_completeness_score=round(random.uniform(70, 100), 1),
@@ -490,9 +505,9 @@ class Command(BaseCommand):
             final_score=round(random.uniform(60, 92), 1),
             matched_keywords=matched,
             missing_keywords=missing,
-            weak_action_verbs=weak_verbs,
+            weak_action_verbs=list(WEAK_ACTION_VERBS),
             missing_quantifications=["Add metrics to experience at " + random.choice(COMPANIES)],
-            suggestions=suggestions,
+            suggestions=list(ANALYSIS_SUGGESTIONS),
         )
 
     # ------------------------------------------------------------------
@@ -0,0 +1,35 @@
+# Generated by Django 4.2.7 on 2026-10-17 15:39
+
+import hashlib
+
+from django.db import migrations, models
+
+
+def populate_job_description_hash(apps, schema_editor):
+    ResumeAnalysis = apps.get_model('resumes', 'ResumeAnalysis')
+    analyses = list(ResumeAnalysis.objects.only('id', 'job_description'))
+    for analysis in analyses:
+        analysis.job_description_hash = hashlib.md5(
+            analysis.job_description.encode('utf-8')
+        ).hexdigest()
+    ResumeAnalysis.objects.bulk_update(analyses, ['job_description_hash'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resumes', '0020_add_ab_testing'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resumeanalysis',
+            name='job_description_hash',
+            field=models.CharField(default='', editable=False, max_length=32),
+        ),
+        migrations.RunPython(populate_job_description_hash, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='resumeanalysis',
+            index=models.Index(fields=['resume', 'job_description_hash'], name='resumes_analysis_jd_hash_idx'),
+        ),
+    ]
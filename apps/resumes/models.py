@@ -1,3 +1,5 @@
+import hashlib
+
 from django.db import models
 from django.contrib.auth.models import User
 from django.core.validators import URLValidator, EmailValidator
@@ -262,6 +264,8 @@ class ResumeAnalysis(models.Model):
     """
     resume = models.ForeignKey(Resume, on_delete=models.CASCADE, related_name='analyses')
     job_description = models.TextField()
+    # Fixed-width digest of job_description, so it can be indexed on any backend
+    job_description_hash = models.CharField(max_length=32, editable=False, default='')
     analysis_timestamp = models.DateTimeField(auto_now_add=True)
     
     # Component Scores
@@ -285,6 +289,8 @@ class ResumeAnalysis(models.Model):
     class Meta:
         indexes = [
             models.Index(fields=['resume', '-analysis_timestamp']),
+            # Natural-key lookup used by the analyzer's update_or_create
+            models.Index(fields=['resume', 'job_description_hash'], name='resumes_analysis_jd_hash_idx'),
         ]
         ordering = ['-analysis_timestamp']
         verbose_name_plural = 'Resume analyses'
@@ -292,6 +298,19 @@ class ResumeAnalysis(models.Model):
     def __str__(self):
         return f"Analysis for {self.resume.title} - Score: {self.final_score}"
 
+    @staticmethod
+    def hash_job_description(job_description):
+        """Return the MD5 hex digest stored in job_description_hash."""
+        return hashlib.md5(job_description.encode('utf-8')).hexdigest()
+
+    def save(self, *args, **kwargs):
+        """Keep job_description_hash in sync with job_description."""
+        self.job_description_hash = self.hash_job_description(self.job_description)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'job_description' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'job_description_hash'}
+        super().save(*args, **kwargs)
+
 
 class Certification(models.Model):
     resume = models.ForeignKey(Resume, on_delete=models.CASCADE, related_name='certifications')
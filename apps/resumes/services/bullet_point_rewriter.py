@@ -1,5 +1,5 @@
 # Bullet point rewriting service
-from typing import Dict, List, Optional
+from typing import Dict, FrozenSet, List, Optional
 import re
 import random
 from apps.analyzer.services.action_verb_analyzer import ActionVerbAnalyzerService
@@ -30,14 +30,40 @@ class BulletPointRewriterService:
         'research': ['researched', 'investigated', 'analyzed', 'studied', 'explored', 'examined'],
     }
     
+    # Fallback verbs when no context keyword matches
+    GENERAL_VERBS = (
+        'achieved', 'accomplished', 'delivered', 'executed', 'implemented',
+        'developed', 'created', 'established', 'improved', 'enhanced'
+    )
+    
+    # Weak verbs split for a single probe per bullet: one-word verbs are a set
+    # lookup on the first word, phrases one anchored regex (longest first, so
+    # 'worked on' wins over 'worked')
+    _WEAK_SINGLE_VERBS = frozenset(
+        verb for verb in ActionVerbAnalyzerService.WEAK_VERBS if ' ' not in verb
+    )
+    _WEAK_PHRASE_RE = re.compile(
+        r'(?:%s)\b' % '|'.join(
+            re.escape(verb)
+            for verb in sorted(ActionVerbAnalyzerService.WEAK_VERBS, key=len, reverse=True)
+            if ' ' in verb
+        ),
+        re.IGNORECASE
+    )
+    
+    _VERB_SUFFIXES = ('ed', 'ing', 'ized', 'ated', 'ified')
+    
     @staticmethod
-    def rewrite_bullet_point(bullet: str, context: Optional[str] = None) -> Dict:
+    def rewrite_bullet_point(bullet: str, context: Optional[str] = None,
+                             context_keywords: Optional[FrozenSet[str]] = None) -> Dict:
         """
         Rewrite a bullet point with stronger action verbs.
         
         Args:
             bullet: Original bullet point text
             context: Optional context (e.g., job description) for better verb selection
+            context_keywords: Optional result of context_keywords(context), for
+                callers rewriting many bullets against the same context
             
         Returns:
             Dictionary containing:
@@ -61,31 +87,25 @@ class BulletPointRewriterService:
         
         # Check if starts with weak verb
         weak_verb_found = None
-        for weak_verb in ActionVerbAnalyzerService.WEAK_VERBS:
-            # Handle multi-word phrases
-            if ' ' in weak_verb:
-                pattern = r'^' + re.escape(weak_verb)
-                if re.search(pattern, rewritten.lower()):
-                    weak_verb_found = weak_verb
-                    break
-            else:
-                # Single word - check if it's the first word
-                words = rewritten.split()
-                if words and words[0].lower() == weak_verb:
-                    weak_verb_found = weak_verb
-                    break
+        phrase_match = BulletPointRewriterService._WEAK_PHRASE_RE.match(rewritten)
+        if phrase_match:
+            weak_verb_found = phrase_match.group(0).lower()
+        else:
+            # Single word - check if it's the first word
+            words = rewritten.split()
+            if words and words[0].lower() in BulletPointRewriterService._WEAK_SINGLE_VERBS:
+                weak_verb_found = words[0].lower()
         
         # Replace weak verb with strong verb
         if weak_verb_found:
             strong_verb = BulletPointRewriterService.select_strong_verb(
-                rewritten, context
+                rewritten, context, context_keywords
             )
             
             # Replace the weak verb
-            if ' ' in weak_verb_found:
-                # Multi-word phrase
-                pattern = r'^' + re.escape(weak_verb_found)
-                rewritten = re.sub(pattern, strong_verb, rewritten, flags=re.IGNORECASE)
+            if phrase_match:
+                # Multi-word phrase (the slice keeps the whitespace after it)
+                rewritten = strong_verb.capitalize() + rewritten[phrase_match.end():]
             else:
                 # Single word
                 words = rewritten.split()
@@ -99,7 +119,7 @@ class BulletPointRewriterService:
         if not BulletPointRewriterService.starts_with_action_verb(rewritten):
             # Add a strong action verb at the beginning
             strong_verb = BulletPointRewriterService.select_strong_verb(
-                rewritten, context
+                rewritten, context, context_keywords
             )
             rewritten = f"{strong_verb.capitalize()} {rewritten}"
             changed = True
@@ -113,34 +133,54 @@ class BulletPointRewriterService:
         }
     
     @staticmethod
-    def select_strong_verb(bullet: str, context: Optional[str] = None) -> str:
+    def select_strong_verb(bullet: str, context: Optional[str] = None,
+                           context_keywords: Optional[FrozenSet[str]] = None) -> str:
         """
         Select an appropriate strong action verb based on context.
         
         Args:
             bullet: Bullet point text
             context: Optional context for better selection
+            context_keywords: Optional precomputed context_keywords(context)
             
         Returns:
             Selected strong action verb
         """
         bullet_lower = bullet.lower()
-        combined_text = bullet_lower
         
-        if context:
-            combined_text += ' ' + context.lower()
+        if context_keywords is None:
+            context_keywords = BulletPointRewriterService.context_keywords(context)
         
         # Check for context keywords and select appropriate verb
         for keyword, verbs in BulletPointRewriterService.CONTEXT_VERB_MAPPING.items():
-            if keyword in combined_text:
+            if keyword in bullet_lower or keyword in context_keywords:
                 return random.choice(verbs)
         
         # If no specific context match, return a general strong verb
-        general_verbs = [
-            'achieved', 'accomplished', 'delivered', 'executed', 'implemented',
-            'developed', 'created', 'established', 'improved', 'enhanced'
-        ]
-        return random.choice(general_verbs)
+        return random.choice(BulletPointRewriterService.GENERAL_VERBS)
+    
+    @staticmethod
+    def context_keywords(context: Optional[str]) -> FrozenSet[str]:
+        """
+        Find the CONTEXT_VERB_MAPPING keywords present in a context.
+        
+        The context is usually a whole job description, so scanning it once
+        and reusing the result beats rescanning it for every bullet.
+        
+        Args:
+            context: Optional context text
+            
+        Returns:
+            Frozenset of mapping keywords found in the context
+        """
+        if not context:
+            return frozenset()
+        
+        context_lower = context.lower()
+        return frozenset(
+            keyword for keyword in BulletPointRewriterService.CONTEXT_VERB_MAPPING
+            if keyword in context_lower
+        )
     
     @staticmethod
     def starts_with_action_verb(bullet: str) -> bool:
@@ -170,8 +210,7 @@ class BulletPointRewriterService:
         # Check if it's NOT a weak verb (could be a decent verb not in our lists)
         if first_word not in ActionVerbAnalyzerService.WEAK_VERBS:
             # Check if it looks like a verb (ends with common verb patterns)
-            verb_patterns = ['ed', 'ing', 'ized', 'ated', 'ified']
-            if any(first_word.endswith(pattern) for pattern in verb_patterns):
+            if first_word.endswith(BulletPointRewriterService._VERB_SUFFIXES):
                 return True
         
         return False
@@ -188,8 +227,8 @@ class BulletPointRewriterService:
         Returns:
             List of rewrite results for each bullet
         """
-        results = []
-        for bullet in bullets:
-            result = BulletPointRewriterService.rewrite_bullet_point(bullet, context)
-            results.append(result)
-        return results
+        context_keywords = BulletPointRewriterService.context_keywords(context)
+        return [
+            BulletPointRewriterService.rewrite_bullet_point(bullet, context, context_keywords)
+            for bullet in bullets
+        ]
@@ -59,6 +59,17 @@ class FormattingStandardizerService:
         'objective': 'Professional Summary',
     }
     
+    # Compiled once per class rather than on every call. Each heading keeps
+    # its own pattern because the substitutions are applied in map order.
+    _HEADING_PATTERNS = [
+        (re.compile(r'(?:^|\n)([•\-\*\s]*)(' + re.escape(non_standard) + r')(\s*:?\s*)', re.IGNORECASE), standard)
+        for non_standard, standard in SECTION_HEADING_MAP.items()
+    ]
+    _HEADING_WORD_PATTERNS = [
+        (re.compile(r'\b' + re.escape(non_standard) + r'\b', re.IGNORECASE), non_standard, standard)
+        for non_standard, standard in SECTION_HEADING_MAP.items()
+    ]
+    
     # Date format patterns
     DATE_PATTERNS = {
         # MM/YYYY -> Month YYYY
@@ -83,6 +94,45 @@ class FormattingStandardizerService:
         (r'^[ \t]+', ''),
     ]
     
+    # Remove special characters that ATS might not handle well
+    # Keep: letters, numbers, basic punctuation, newlines
+    # Remove: fancy quotes, em dashes, special bullets, etc.
+    SPECIAL_CHAR_MAP = {
+        '"': '"',  # Smart quotes to regular
+        '"': '"',
+        ''': "'",
+        ''': "'",
+        '—': '-',  # Em dash to hyphen
+        '–': '-',  # En dash to hyphen
+        '•': '-',  # Bullet to hyphen
+        '◦': '-',
+        '▪': '-',
+        '▫': '-',
+    }
+    
+    _DATE_PATTERNS = [(re.compile(pattern), formatter) for pattern, formatter in DATE_PATTERNS.items()]
+    _PROBLEMATIC_PATTERNS = [
+        (re.compile(pattern, re.MULTILINE), replacement) for pattern, replacement in PROBLEMATIC_PATTERNS
+    ]
+    # Rules that match a single literal character are applied with str
+    # methods, which skip the regex engine entirely
+    _LITERAL_PATTERNS = {r'\t': '\t'}
+    
+    # Matches anywhere any of the passes above could change the text. It may
+    # over-match (line starts, case), never under-match, so text it does not
+    # match is already standardized and standardize_all can return it as is.
+    _NEEDS_STANDARDIZING = re.compile(
+        '|'.join(
+            f'(?:{pattern})' for pattern in (
+                [r'^[•\-\*\s]*(?:' + '|'.join(map(re.escape, SECTION_HEADING_MAP)) + ')']
+                + list(DATE_PATTERNS)
+                + [pattern for pattern, _ in PROBLEMATIC_PATTERNS]
+                + list(map(re.escape, SPECIAL_CHAR_MAP))
+            )
+        ),
+        re.IGNORECASE | re.MULTILINE
+    )
+    
     @staticmethod
     def standardize_section_headings(text: str) -> Dict:
         """
@@ -108,11 +158,8 @@ class FormattingStandardizerService:
         changes = []
         
         # Look for section headings (typically at start of line, may have formatting)
-        for non_standard, standard in FormattingStandardizerService.SECTION_HEADING_MAP.items():
-            # Case-insensitive pattern matching
-            # Match heading at start of line or after newline
-            pattern = r'(?:^|\n)([•\-\*\s]*)(' + re.escape(non_standard) + r')(\s*:?\s*)'
-            
+        # Case-insensitive match of the heading at start of line or after newline
+        for pattern, standard in FormattingStandardizerService._HEADING_PATTERNS:
             def replace_heading(match):
                 prefix = match.group(1)
                 heading = match.group(2)
@@ -129,7 +176,7 @@ class FormattingStandardizerService:
                 # Return standardized format (no prefix bullets, with colon)
                 return f"\n{standard}:"
             
-            standardized = re.sub(pattern, replace_heading, standardized, flags=re.IGNORECASE)
+            standardized = pattern.sub(replace_heading, standardized)
         
         return {
             'original': text,
@@ -162,8 +209,8 @@ class FormattingStandardizerService:
         changes = []
         
         # Apply each date pattern
-        for pattern, formatter in FormattingStandardizerService.DATE_PATTERNS.items():
-            matches = list(re.finditer(pattern, standardized))
+        for pattern, formatter in FormattingStandardizerService._DATE_PATTERNS:
+            matches = list(pattern.finditer(standardized))
             
             for match in reversed(matches):  # Reverse to maintain positions
                 old_date = match.group(0)
@@ -210,36 +257,26 @@ class FormattingStandardizerService:
         cleaned = text
         changes = []
         
-        # Apply each problematic pattern fix
-        for pattern, replacement in FormattingStandardizerService.PROBLEMATIC_PATTERNS:
-            matches = list(re.finditer(pattern, cleaned, flags=re.MULTILINE))
+        # Apply each problematic pattern fix (subn counts and replaces in one scan)
+        for pattern, replacement in FormattingStandardizerService._PROBLEMATIC_PATTERNS:
+            literal = FormattingStandardizerService._LITERAL_PATTERNS.get(pattern.pattern)
+            if literal is not None:
+                occurrences = cleaned.count(literal)
+                if occurrences:
+                    cleaned = cleaned.replace(literal, replacement)
+            else:
+                cleaned, occurrences = pattern.subn(replacement, cleaned)
             
-            if matches:
+            if occurrences:
                 changes.append({
                     'type': 'formatting_cleanup',
-                    'pattern': pattern,
-                    'occurrences': len(matches)
+                    'pattern': pattern.pattern,
+                    'occurrences': occurrences
                 })
-                
-                cleaned = re.sub(pattern, replacement, cleaned, flags=re.MULTILINE)
-        
-        # Remove special characters that ATS might not handle well
-        # Keep: letters, numbers, basic punctuation, newlines
-        # Remove: fancy quotes, em dashes, special bullets, etc.
-        special_char_map = {
-            '"': '"',  # Smart quotes to regular
-            '"': '"',
-            ''': "'",
-            ''': "'",
-            '—': '-',  # Em dash to hyphen
-            '–': '-',  # En dash to hyphen
-            '•': '-',  # Bullet to hyphen
-            '◦': '-',
-            '▪': '-',
-            '▫': '-',
-        }
         
-        for special, replacement in special_char_map.items():
+        # Replace special characters that ATS might not handle well
+        
+        for special, replacement in FormattingStandardizerService.SPECIAL_CHAR_MAP.items():
             if special in cleaned:
                 count = cleaned.count(special)
                 cleaned = cleaned.replace(special, replacement)
@@ -277,6 +314,14 @@ class FormattingStandardizerService:
                 'all_changes': []
             }
         
+        # Already ATS-clean: none of the passes would change anything
+        if not FormattingStandardizerService._NEEDS_STANDARDIZING.search(text):
+            return {
+                'original': text,
+                'standardized': text,
+                'all_changes': []
+            }
+        
         all_changes = []
         current_text = text
         
@@ -352,7 +397,7 @@ class FormattingStandardizerService:
         score = 100.0
         
         # Check for problematic patterns
-        if re.search(r'\t', text):
+        if '\t' in text:
             issues.append('Contains tab characters')
             score -= 10
         
@@ -368,9 +413,8 @@ class FormattingStandardizerService:
                 score -= 5
         
         # Check for non-standard section headings
-        for non_standard in FormattingStandardizerService.SECTION_HEADING_MAP.keys():
-            if re.search(r'\b' + re.escape(non_standard) + r'\b', text, re.IGNORECASE):
-                standard = FormattingStandardizerService.SECTION_HEADING_MAP[non_standard]
+        for pattern, non_standard, standard in FormattingStandardizerService._HEADING_WORD_PATTERNS:
+            if pattern.search(text):
                 if non_standard.lower() != standard.lower():
                     issues.append(f'Non-standard section heading: "{non_standard}"')
                     score -= 3
@@ -1,4 +1,5 @@
 # Keyword injection service
+from functools import lru_cache
 from typing import Dict, List, Set, Optional
 import random
 from apps.analyzer.services.keyword_extractor import KeywordExtractorService
@@ -49,6 +50,22 @@ class KeywordInjectorService:
         ]
     }
     
+    # Substrings used by _classify_keyword to pick a template category
+    TECH_INDICATORS = (
+        'python', 'java', 'javascript', 'react', 'angular', 'vue',
+        'node', 'django', 'flask', 'spring', 'sql', 'nosql',
+        'mongodb', 'postgresql', 'mysql', 'redis', 'aws', 'azure',
+        'docker', 'kubernetes', 'git', 'jenkins', 'ci/cd'
+    )
+    METHODOLOGY_INDICATORS = (
+        'agile', 'scrum', 'kanban', 'waterfall', 'devops',
+        'tdd', 'bdd', 'ci/cd', 'microservices', 'rest', 'api'
+    )
+    TOOL_INDICATORS = (
+        'jira', 'confluence', 'slack', 'trello', 'asana',
+        'github', 'gitlab', 'bitbucket', 'visual studio'
+    )
+    
     @staticmethod
     def inject_keywords(resume, missing_keywords: Set[str], job_description: str, max_keywords: int = 10) -> List[Dict]:
         """
@@ -67,7 +84,9 @@ class KeywordInjectorService:
             return []
         
         # Prioritize keywords by frequency in job description
-        keyword_freq = KeywordExtractorService.calculate_keyword_frequency(job_description)
+        keyword_freq = KeywordExtractorService.calculate_keyword_frequency(
+            job_description, only=missing_keywords
+        )
         
         # Sort keywords by frequency (descending)
         sorted_keywords = sorted(
@@ -222,10 +241,14 @@ class KeywordInjectorService:
             return f"{text}. {injected_phrase}"
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _classify_keyword(keyword: str) -> str:
         """
         Classify keyword type for appropriate template selection.
         
+        Pure function of the keyword, so results are cached: the same
+        keywords recur across every experience and project checked.
+        
         Args:
             keyword: Keyword to classify
             
@@ -235,29 +258,15 @@ class KeywordInjectorService:
         keyword_lower = keyword.lower()
         
         # Technology keywords
-        tech_indicators = [
-            'python', 'java', 'javascript', 'react', 'angular', 'vue',
-            'node', 'django', 'flask', 'spring', 'sql', 'nosql',
-            'mongodb', 'postgresql', 'mysql', 'redis', 'aws', 'azure',
-            'docker', 'kubernetes', 'git', 'jenkins', 'ci/cd'
-        ]
-        if any(tech in keyword_lower for tech in tech_indicators):
+        if any(tech in keyword_lower for tech in KeywordInjectorService.TECH_INDICATORS):
             return 'technology'
         
         # Methodology keywords
-        methodology_indicators = [
-            'agile', 'scrum', 'kanban', 'waterfall', 'devops',
-            'tdd', 'bdd', 'ci/cd', 'microservices', 'rest', 'api'
-        ]
-        if any(method in keyword_lower for method in methodology_indicators):
+        if any(method in keyword_lower for method in KeywordInjectorService.METHODOLOGY_INDICATORS):
             return 'methodology'
         
         # Tool keywords
-        tool_indicators = [
-            'jira', 'confluence', 'slack', 'trello', 'asana',
-            'github', 'gitlab', 'bitbucket', 'visual studio'
-        ]
-        if any(tool in keyword_lower for tool in tool_indicators):
+        if any(tool in keyword_lower for tool in KeywordInjectorService.TOOL_INDICATORS):
             return 'tool'
         
         # Default to skill
@@ -275,7 +284,9 @@ class KeywordInjectorService:
         Returns:
             List of (keyword, priority_score) tuples sorted by priority
         """
-        keyword_freq = KeywordExtractorService.calculate_keyword_frequency(job_description)
+        keyword_freq = KeywordExtractorService.calculate_keyword_frequency(
+            job_description, only=keywords
+        )
         
         # Calculate priority scores
         priorities = []
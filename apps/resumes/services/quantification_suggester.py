@@ -1,5 +1,5 @@
 # Quantification suggestion service
-from typing import Dict, List
+from typing import Dict, List, Optional, Sequence
 import re
 from apps.analyzer.services.quantification_detector import QuantificationDetectorService
 
@@ -54,6 +54,11 @@ class QuantificationSuggesterService:
         ],
     }
     
+    _COMPILED_ACHIEVEMENT_PATTERNS = {
+        achievement_type: [re.compile(pattern) for pattern in patterns]
+        for achievement_type, patterns in ACHIEVEMENT_PATTERNS.items()
+    }
+    
     # Metric suggestions by achievement type
     METRIC_SUGGESTIONS = {
         'performance': [
@@ -216,11 +221,10 @@ class QuantificationSuggesterService:
         # Score each achievement type
         type_scores = {}
         
-        for achievement_type, patterns in QuantificationSuggesterService.ACHIEVEMENT_PATTERNS.items():
+        for achievement_type, patterns in QuantificationSuggesterService._COMPILED_ACHIEVEMENT_PATTERNS.items():
             score = 0
             for pattern in patterns:
-                matches = re.findall(pattern, bullet_lower)
-                score += len(matches)
+                score += len(pattern.findall(bullet_lower))
             
             if score > 0:
                 type_scores[achievement_type] = score
@@ -297,12 +301,15 @@ class QuantificationSuggesterService:
         )
     
     @staticmethod
-    def analyze_experience_quantification(experience_description: str) -> Dict:
+    def analyze_experience_quantification(experience_description: str,
+                                          bullets: Optional[Sequence[str]] = None) -> Dict:
         """
         Analyze quantification coverage in an experience description.
         
         Args:
             experience_description: Full experience description text
+            bullets: Optional description already split into stripped lines,
+                for callers that have split it for other passes
             
         Returns:
             Dictionary with analysis results
@@ -317,8 +324,9 @@ class QuantificationSuggesterService:
             }
         
         # Split into bullet points
-        lines = experience_description.split('\n')
-        bullets = [line.strip() for line in lines if line.strip() and len(line.strip()) > 20]
+        if bullets is None:
+            bullets = [line.strip() for line in experience_description.split('\n')]
+        bullets = [bullet for bullet in bullets if len(bullet) > 20]
         
         quantified = []
         unquantified = []
@@ -1,5 +1,5 @@
 # Resume optimization orchestrator service
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set, Tuple
 from .bullet_point_rewriter import BulletPointRewriterService
 from .keyword_injector import KeywordInjectorService
 from .quantification_suggester import QuantificationSuggesterService
@@ -62,10 +62,18 @@ class ResumeOptimizerService:
             'total_changes': 0
         }
         
+        # The passes below are independent but run sequentially on purpose:
+        # they are pure-Python string work that holds the GIL, so threads
+        # would not overlap them, and worker threads get their own DB
+        # connections, which cannot see the caller's open transaction.
+        
+        # Descriptions are split into bullets once and shared by the passes
+        experience_bullets = ResumeOptimizerService._split_experience_bullets(resume)
+        
         # 1. Rewrite bullet points with strong action verbs
         if rewrite_bullets:
             bullet_changes = ResumeOptimizerService._optimize_bullet_points(
-                resume, job_description
+                resume, job_description, experience_bullets
             )
             detailed_changes.extend(bullet_changes)
             changes_summary['bullet_rewrites'] = len(bullet_changes)
@@ -86,7 +94,9 @@ class ResumeOptimizerService:
         
         # 3. Suggest quantifications
         if suggest_quantifications:
-            quant_changes = ResumeOptimizerService._suggest_quantifications(resume)
+            quant_changes = ResumeOptimizerService._suggest_quantifications(
+                resume, experience_bullets
+            )
             detailed_changes.extend(quant_changes)
             changes_summary['quantification_suggestions'] = len(quant_changes)
         
@@ -127,31 +137,48 @@ class ResumeOptimizerService:
         }
     
     @staticmethod
-    def _optimize_bullet_points(resume, job_description: str) -> List[Dict]:
+    def _split_experience_bullets(resume) -> List[Tuple]:
+        """
+        Split each experience description into bullet points.
+        
+        Args:
+            resume: Resume model instance
+            
+        Returns:
+            List of (experience, bullets) pairs for experiences with a
+            description; bullets are the stripped, non-empty lines
+        """
+        return [
+            (experience, tuple(line.strip() for line in experience.description.split('\n') if line.strip()))
+            for experience in resume.experiences.all()
+            if experience.description
+        ]
+    
+    @staticmethod
+    def _optimize_bullet_points(resume, job_description: str,
+                                experience_bullets: Optional[List[Tuple]] = None) -> List[Dict]:
         """
         Optimize bullet points in experience descriptions.
         
         Args:
             resume: Resume model instance
             job_description: Job description for context
+            experience_bullets: Optional result of _split_experience_bullets
             
         Returns:
             List of bullet point changes
         """
         changes = []
+        context_keywords = BulletPointRewriterService.context_keywords(job_description)
         
-        for experience in resume.experiences.all():
-            if not experience.description:
-                continue
-            
-            # Split description into bullet points
-            lines = experience.description.split('\n')
-            bullets = [line.strip() for line in lines if line.strip()]
-            
+        if experience_bullets is None:
+            experience_bullets = ResumeOptimizerService._split_experience_bullets(resume)
+        
+        for experience, bullets in experience_bullets:
             # Rewrite each bullet
             for i, bullet in enumerate(bullets):
                 result = BulletPointRewriterService.rewrite_bullet_point(
-                    bullet, job_description
+                    bullet, job_description, context_keywords
                 )
                 
                 if result['changed']:
@@ -169,25 +196,26 @@ class ResumeOptimizerService:
         return changes
     
     @staticmethod
-    def _suggest_quantifications(resume) -> List[Dict]:
+    def _suggest_quantifications(resume, experience_bullets: Optional[List[Tuple]] = None) -> List[Dict]:
         """
         Suggest quantifications for achievements lacking metrics.
         
         Args:
             resume: Resume model instance
+            experience_bullets: Optional result of _split_experience_bullets
             
         Returns:
             List of quantification suggestions
         """
         changes = []
         
-        for experience in resume.experiences.all():
-            if not experience.description:
-                continue
-            
+        if experience_bullets is None:
+            experience_bullets = ResumeOptimizerService._split_experience_bullets(resume)
+        
+        for experience, bullets in experience_bullets:
             # Analyze quantification coverage
             analysis = QuantificationSuggesterService.analyze_experience_quantification(
-                experience.description
+                experience.description, bullets
             )
             
             # Add suggestions for unquantified bullets
@@ -4,6 +4,7 @@ Business logic services for resume management.
 from django.db import transaction
 from django.shortcuts import get_object_or_404
 from apps.resumes.models import Resume, PersonalInfo, Experience, Education, Skill, Project
+from apps.resumes.signals import refresh_completeness
 from apps.resumes.utils.query_optimization import (
     get_resume_with_relations,
     get_user_resumes_optimized,
@@ -92,17 +93,22 @@ class ResumeService:
                         end_year=edu_data.get('end_year'),
                     )
 
-            # Create skills if provided
+            # Create skills if provided (fresh resume, so every row is new:
+            # insert them in one statement instead of one INSERT per skill)
             if 'skills' in data:
-                for skill_data in data['skills']:
-                    name = skill_data.get('name', '').strip()
-                    if not name:
-                        continue
-                    Skill.objects.create(
+                skills = [
+                    Skill(
                         resume=resume,
-                        name=name,
+                        name=skill_data.get('name', '').strip(),
                         category=skill_data.get('category') or 'General',
                     )
+                    for skill_data in data['skills']
+                    if skill_data.get('name', '').strip()
+                ]
+                if skills:
+                    Skill.objects.bulk_create(skills)
+                    # bulk_create bypasses post_save, so refresh completeness once
+                    refresh_completeness(resume.id)
 
             # Create projects if provided
             if 'projects' in data:
@@ -157,12 +163,13 @@ class ResumeService:
                 resume.template = data['template']
             resume.save()
             
-            # Update personal info if provided
+            # Update personal info if provided (one lookup + one write, instead of
+            # get_or_create's extra INSERT followed by a second save)
             if 'personal_info' in data:
-                personal_info, created = PersonalInfo.objects.get_or_create(resume=resume)
-                for key, value in data['personal_info'].items():
-                    setattr(personal_info, key, value)
-                personal_info.save()
+                PersonalInfo.objects.update_or_create(
+                    resume=resume,
+                    defaults=data['personal_info'],
+                )
             
             # Update experiences if provided
             if 'experiences' in data:
@@ -0,0 +1,35 @@
+"""
+Unit tests for BulletPointRewriterService
+"""
+from django.test import SimpleTestCase
+from apps.resumes.services.bullet_point_rewriter import BulletPointRewriterService
+
+
+class BulletPointRewriterServiceTest(SimpleTestCase):
+    """Test cases for BulletPointRewriterService"""
+    
+    def test_rewrite_phrase_prefix_of_longer_word(self):
+        """Test that 'Worked onboarding' is treated as the verb 'worked', not 'worked on'"""
+        result = BulletPointRewriterService.rewrite_bullet_point('Worked onboarding new hires')
+        
+        self.assertTrue(result['changed'])
+        self.assertIn("weak verb 'worked'", result['reason'])
+        self.assertTrue(result['rewritten'].endswith(' onboarding new hires'))
+        self.assertTrue(result['rewritten'][0].isupper())
+    
+    def test_rewrite_single_verb_followed_by_phrase_prefix(self):
+        """Test that 'Helped within' keeps the word 'within' intact"""
+        result = BulletPointRewriterService.rewrite_bullet_point('Helped within the support team')
+        
+        self.assertIn("weak verb 'helped'", result['reason'])
+        self.assertTrue(result['rewritten'].endswith(' within the support team'))
+        self.assertEqual(len(result['rewritten'].split()), 5)
+    
+    def test_rewrite_multi_word_phrase(self):
+        """Test that a weak phrase is replaced by one capitalised verb"""
+        result = BulletPointRewriterService.rewrite_bullet_point('Worked on APIs')
+        
+        self.assertIn("weak verb 'worked on'", result['reason'])
+        verb, rest = result['rewritten'].split(' ', 1)
+        self.assertEqual(rest, 'APIs')
+        self.assertTrue(verb[0].isupper())
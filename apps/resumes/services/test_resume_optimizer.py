@@ -3,7 +3,8 @@ Unit tests for ResumeOptimizerService
 """
 from django.test import TestCase
 from django.contrib.auth.models import User
-from apps.resumes.models import Resume, PersonalInfo, Experience, Education, Skill, Project
+from apps.resumes.models import Resume, PersonalInfo, Experience
+from apps.resumes.testing import build_full_resume
 from apps.resumes.services.resume_optimizer import ResumeOptimizerService
 from datetime import date
 
@@ -20,58 +21,11 @@ class ResumeOptimizerServiceTest(TestCase):
             password='testpass123'
         )
         
-        # Create test resume
-        self.resume = Resume.objects.create(
-            user=self.user,
-            title='Test Resume',
-            template='professional'
-        )
-        
-        # Create personal info
-        self.personal_info = PersonalInfo.objects.create(
-            resume=self.resume,
-            full_name='John Doe',
-            phone='555-1234',
-            email='john@example.com',
-            location='New York, NY'
-        )
-        
-        # Create experience with weak verbs
-        self.experience = Experience.objects.create(
-            resume=self.resume,
-            company='Tech Corp',
-            role='Software Engineer',
-            start_date=date(2020, 1, 1),
-            end_date=date(2023, 12, 31),
-            description='Worked on web applications\nHelped with testing\nResponsible for bug fixes',
-            order=0
-        )
-        
-        # Create education
-        self.education = Education.objects.create(
-            resume=self.resume,
-            institution='University',
-            degree='BS',
-            field='Computer Science',
-            start_year=2016,
-            end_year=2020,
-            order=0
-        )
-        
-        # Create skill
-        self.skill = Skill.objects.create(
-            resume=self.resume,
-            name='Python',
-            category='Programming'
-        )
-        
-        # Create project
-        self.project = Project.objects.create(
-            resume=self.resume,
-            name='Test Project',
-            description='Built a web application',
-            technologies='Python, Django',
-            order=0
+        # Create test resume with one row in every section
+        self.resume = build_full_resume(
+            self.user,
+            experience={'description': 'Worked on web applications\nHelped with testing\nResponsible for bug fixes'},
+            project={'description': 'Built a web application'},
         )
         
         # Job description with keywords
@@ -3,7 +3,8 @@ Unit tests for VersionService
 """
 from django.test import TestCase
 from django.contrib.auth.models import User
-from apps.resumes.models import Resume, ResumeVersion, PersonalInfo, Experience, Education, Skill, Project
+from apps.resumes.models import Resume, ResumeVersion, Experience
+from apps.resumes.testing import build_full_resume
 from apps.resumes.services.version_service import VersionService
 from datetime import date
 
@@ -20,59 +21,9 @@ class VersionServiceTest(TestCase):
             password='testpass123'
         )
         
-        # Create test resume
-        self.resume = Resume.objects.create(
-            user=self.user,
-            title='Test Resume',
-            template='professional'
-        )
-        
-        # Create personal info
-        self.personal_info = PersonalInfo.objects.create(
-            resume=self.resume,
-            full_name='John Doe',
-            phone='555-1234',
-            email='john@example.com',
-            location='New York, NY'
-        )
-        
-        # Create experience
-        self.experience = Experience.objects.create(
-            resume=self.resume,
-            company='Tech Corp',
-            role='Software Engineer',
-            start_date=date(2020, 1, 1),
-            end_date=date(2023, 12, 31),
-            description='Developed web applications',
-            order=0
-        )
-        
-        # Create education
-        self.education = Education.objects.create(
-            resume=self.resume,
-            institution='University',
-            degree='BS',
-            field='Computer Science',
-            start_year=2016,
-            end_year=2020,
-            order=0
-        )
-        
-        # Create skill
-        self.skill = Skill.objects.create(
-            resume=self.resume,
-            name='Python',
-            category='Programming'
-        )
-        
-        # Create project
-        self.project = Project.objects.create(
-            resume=self.resume,
-            name='Test Project',
-            description='A test project',
-            technologies='Python, Django',
-            order=0
-        )
+        # Create test resume with one row in every section
+        self.resume = build_full_resume(self.user)
+        self.personal_info = self.resume.personal_info
     
     def test_create_version_basic(self):
         """Test basic version creation"""
@@ -168,6 +119,19 @@ class VersionServiceTest(TestCase):
         history = VersionService.get_version_history(self.resume)
         self.assertEqual(len(history), 0)
     
+    def test_get_version_history_qs(self):
+        """Test version history queryset can be counted and sliced lazily"""
+        for _ in range(3):
+            VersionService.create_version(self.resume)
+        
+        history_qs = VersionService.get_version_history_qs(self.resume)
+        
+        self.assertEqual(history_qs.count(), 3)
+        self.assertEqual(
+            [v.version_number for v in history_qs[:2]],
+            [3, 2]
+        )
+    
     def test_compare_versions_no_changes(self):
         """Test comparing identical versions"""
         v1 = VersionService.create_version(self.resume)
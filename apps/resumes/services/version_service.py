@@ -1,7 +1,7 @@
 # Resume version control service
 from typing import Dict, List, Optional
 from django.db import transaction
-from django.db.models import Max
+from django.db.models import Max, QuerySet
 from django.utils import timezone
 from apps.resumes.models import Resume, ResumeVersion
 import json
@@ -134,6 +134,27 @@ class VersionService:
         
         return snapshot
     
+    @staticmethod
+    def get_version_history_qs(resume: Resume) -> QuerySet:
+        """
+        Get a lazy queryset of a resume's versions in reverse chronological order.
+        
+        Callers can count, slice or defer columns (e.g. snapshot_data) before
+        any rows are fetched.
+        
+        Args:
+            resume: Resume instance
+            
+        Returns:
+            QuerySet: Ordered, unevaluated ResumeVersion queryset
+        """
+        # Join the owning resume/user so callers reading version.resume don't trigger N+1 queries
+        return (
+            ResumeVersion.objects.filter(resume=resume)
+            .select_related('resume', 'resume__user')
+            .order_by('-version_number')
+        )
+    
     @staticmethod
     def get_version_history(resume: Resume) -> List[ResumeVersion]:
         """
@@ -145,7 +166,7 @@ class VersionService:
         Returns:
             List[ResumeVersion]: Ordered list of versions
         """
-        return list(ResumeVersion.objects.filter(resume=resume).order_by('-version_number'))
+        return list(VersionService.get_version_history_qs(resume))
     
     @staticmethod
     def compare_versions(version1: ResumeVersion, version2: ResumeVersion) -> Dict:
@@ -231,10 +252,12 @@ class VersionService:
     @staticmethod
     def _compare_dict(dict1: Dict, dict2: Dict, section: str) -> List[Dict]:
         """Compare two dictionaries and return changes."""
+        if dict1 == dict2:
+            return []
+        
         changes = []
-        all_keys = set(dict1.keys()) | set(dict2.keys())
         
-        for key in all_keys:
+        for key in dict1.keys() | dict2.keys():
             val1 = dict1.get(key)
             val2 = dict2.get(key)
             
@@ -260,55 +283,62 @@ class VersionService:
     def _compare_list(list1: List[Dict], list2: List[Dict], 
                      section: str, key_field: str) -> List[Dict]:
         """Compare two lists of dictionaries and return changes."""
+        # Unchanged sections are the common case; one C-level equality
+        # check avoids building lookups for them
+        if list1 == list2:
+            return []
+        
         changes = []
         
         # Create lookup dictionaries
         dict1 = {item.get(key_field): item for item in list1}
         dict2 = {item.get(key_field): item for item in list2}
         
-        all_keys = set(dict1.keys()) | set(dict2.keys())
+        # Key-set differences split items into deleted, added and shared
+        for key in dict1.keys() - dict2.keys():
+            # Deleted in version 2
+            changes.append({
+                'section': section,
+                'item': key,
+                'type': 'deleted',
+                'old_value': dict1[key],
+                'new_value': None,
+            })
+        
+        for key in dict2.keys() - dict1.keys():
+            # Added in version 2
+            changes.append({
+                'section': section,
+                'item': key,
+                'type': 'added',
+                'old_value': None,
+                'new_value': dict2[key],
+            })
         
-        for key in all_keys:
-            item1 = dict1.get(key)
-            item2 = dict2.get(key)
+        for key in dict1.keys() & dict2.keys():
+            item1 = dict1[key]
+            item2 = dict2[key]
+            if item1 == item2:
+                continue
             
-            if item1 is None:
-                # Added in version 2
-                changes.append({
-                    'section': section,
-                    'item': key,
-                    'type': 'added',
-                    'old_value': None,
-                    'new_value': item2,
-                })
-            elif item2 is None:
-                # Deleted in version 2
+            # Modified: find specific field changes
+            field_changes = [
+                {
+                    'field': field,
+                    'old': item1.get(field),
+                    'new': item2.get(field),
+                }
+                for field in item1.keys() | item2.keys()
+                if item1.get(field) != item2.get(field)
+            ]
+            
+            if field_changes:
                 changes.append({
                     'section': section,
                     'item': key,
-                    'type': 'deleted',
-                    'old_value': item1,
-                    'new_value': None,
+                    'type': 'modified',
+                    'field_changes': field_changes,
                 })
-            elif item1 != item2:
-                # Modified
-                # Find specific field changes
-                field_changes = []
-                for field in item1.keys() | item2.keys():
-                    if item1.get(field) != item2.get(field):
-                        field_changes.append({
-                            'field': field,
-                            'old': item1.get(field),
-                            'new': item2.get(field),
-                        })
-                
-                if field_changes:
-                    changes.append({
-                        'section': section,
-                        'item': key,
-                        'type': 'modified',
-                        'field_changes': field_changes,
-                    })
         
         return changes
     
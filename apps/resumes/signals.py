@@ -9,7 +9,7 @@ from django.dispatch import receiver
 logger = logging.getLogger(__name__)
 
 
-def _refresh_completeness(resume_id: int):
+def refresh_completeness(resume_id: int):
     """Recalculate and persist completeness score for a single resume."""
     try:
         from apps.resumes.models import Resume
@@ -25,27 +25,27 @@ def _refresh_completeness(resume_id: int):
 @receiver(post_save, sender='resumes.Experience')
 @receiver(post_delete, sender='resumes.Experience')
 def on_experience_change(sender, instance, **kwargs):
-    _refresh_completeness(instance.resume_id)
+    refresh_completeness(instance.resume_id)
 
 
 @receiver(post_save, sender='resumes.Education')
 @receiver(post_delete, sender='resumes.Education')
 def on_education_change(sender, instance, **kwargs):
-    _refresh_completeness(instance.resume_id)
+    refresh_completeness(instance.resume_id)
 
 
 @receiver(post_save, sender='resumes.Skill')
 @receiver(post_delete, sender='resumes.Skill')
 def on_skill_change(sender, instance, **kwargs):
-    _refresh_completeness(instance.resume_id)
+    refresh_completeness(instance.resume_id)
 
 
 @receiver(post_save, sender='resumes.Project')
 @receiver(post_delete, sender='resumes.Project')
 def on_project_change(sender, instance, **kwargs):
-    _refresh_completeness(instance.resume_id)
+    refresh_completeness(instance.resume_id)
 
 
 @receiver(post_save, sender='resumes.PersonalInfo')
 def on_personal_info_change(sender, instance, **kwargs):
-    _refresh_completeness(instance.resume_id)
+    refresh_completeness(instance.resume_id)
@@ -20,24 +20,25 @@ from datetime import date, timedelta
 class OptimizationFlowIntegrationTest(TestCase):
     """Test complete optimization workflow end-to-end"""
     
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data"""
         # Create user
-        self.user = User.objects.create_user(
+        cls.user = User.objects.create_user(
             username='testuser',
             password='testpass123',
             email='test@example.com'
         )
         
         # Create resume with weak content
-        self.resume = Resume.objects.create(
-            user=self.user,
+        cls.resume = Resume.objects.create(
+            user=cls.user,
             title='Test Resume',
             template='professional'
         )
         
         PersonalInfo.objects.create(
-            resume=self.resume,
+            resume=cls.resume,
             full_name='John Doe',
             email='john@example.com',
             phone='555-1234',
@@ -45,7 +46,7 @@ class OptimizationFlowIntegrationTest(TestCase):
         )
         
         Experience.objects.create(
-            resume=self.resume,
+            resume=cls.resume,
             company='Tech Corp',
             role='Developer',
             start_date=date(2020, 1, 1),
@@ -55,7 +56,7 @@ class OptimizationFlowIntegrationTest(TestCase):
         )
         
         Education.objects.create(
-            resume=self.resume,
+            resume=cls.resume,
             institution='University',
             degree='BS',
             field='Computer Science',
@@ -65,12 +66,12 @@ class OptimizationFlowIntegrationTest(TestCase):
         )
         
         Skill.objects.create(
-            resume=self.resume,
+            resume=cls.resume,
             name='Python',
             category='Programming'
         )
         
-        self.job_description = """
+        cls.job_description = """
         We are looking for a Senior Software Engineer with:
         - Python and Django expertise
         - React and JavaScript skills
@@ -83,10 +84,11 @@ class OptimizationFlowIntegrationTest(TestCase):
         - Mentor junior developers
         - Implement CI/CD pipelines
         """ * 2  # Make it long enough
-        
+    
+    def setUp(self):
         # Login
         self.client = Client()
-        self.client.login(username='testuser', password='testpass123')
+        self.client.force_login(self.user)
     
     def test_complete_optimization_flow(self):
         """Test complete optimization workflow from start to finish"""
@@ -161,30 +163,31 @@ class OptimizationFlowIntegrationTest(TestCase):
 class VersionManagementFlowIntegrationTest(TestCase):
     """Test complete version management workflow end-to-end"""
     
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data"""
         # Create user
-        self.user = User.objects.create_user(
+        cls.user = User.objects.create_user(
             username='testuser',
             password='testpass123',
             email='test@example.com'
         )
         
         # Create resume
-        self.resume = Resume.objects.create(
-            user=self.user,
+        cls.resume = Resume.objects.create(
+            user=cls.user,
             title='Test Resume',
             template='professional'
         )
         
         PersonalInfo.objects.create(
-            resume=self.resume,
+            resume=cls.resume,
             full_name='John Doe',
             email='john@example.com'
         )
         
         Experience.objects.create(
-            resume=self.resume,
+            resume=cls.resume,
             company='Tech Corp',
             role='Developer',
             start_date=date(2020, 1, 1),
@@ -194,21 +197,22 @@ class VersionManagementFlowIntegrationTest(TestCase):
         
         # Create multiple versions
         from apps.resumes.services.version_service import VersionService
-        self.version1 = VersionService.create_version(self.resume, ats_score=70.0)
+        cls.version1 = VersionService.create_version(cls.resume, ats_score=70.0)
         
         # Modify resume
-        self.resume.title = 'Updated Resume'
-        self.resume.save()
-        self.version2 = VersionService.create_version(self.resume, ats_score=75.0)
+        cls.resume.title = 'Updated Resume'
+        cls.resume.save()
+        cls.version2 = VersionService.create_version(cls.resume, ats_score=75.0)
         
         # Modify again
-        self.resume.title = 'Final Resume'
-        self.resume.save()
-        self.version3 = VersionService.create_version(self.resume, ats_score=80.0)
-        
+        cls.resume.title = 'Final Resume'
+        cls.resume.save()
+        cls.version3 = VersionService.create_version(cls.resume, ats_score=80.0)
+    
+    def setUp(self):
         # Login
         self.client = Client()
-        self.client.login(username='testuser', password='testpass123')
+        self.client.force_login(self.user)
     
     def test_complete_version_management_flow(self):
         """Test complete version management workflow"""
@@ -268,24 +272,25 @@ class VersionManagementFlowIntegrationTest(TestCase):
 class AnalyticsDashboardFlowIntegrationTest(TestCase):
     """Test complete analytics dashboard workflow end-to-end"""
     
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data"""
         # Create user
-        self.user = User.objects.create_user(
+        cls.user = User.objects.create_user(
             username='testuser',
             password='testpass123',
             email='test@example.com'
         )
         
         # Create resume
-        self.resume = Resume.objects.create(
-            user=self.user,
+        cls.resume = Resume.objects.create(
+            user=cls.user,
             title='Test Resume',
             template='professional'
         )
         
         PersonalInfo.objects.create(
-            resume=self.resume,
+            resume=cls.resume,
             full_name='John Doe',
             email='john@example.com',
             phone='555-1234',
@@ -293,7 +298,7 @@ class AnalyticsDashboardFlowIntegrationTest(TestCase):
         )
         
         Experience.objects.create(
-            resume=self.resume,
+            resume=cls.resume,
             company='Tech Corp',
             role='Developer',
             start_date=date(2020, 1, 1),
@@ -302,7 +307,7 @@ class AnalyticsDashboardFlowIntegrationTest(TestCase):
         )
         
         Education.objects.create(
-            resume=self.resume,
+            resume=cls.resume,
             institution='University',
             degree='BS',
             field='Computer Science',
@@ -312,7 +317,7 @@ class AnalyticsDashboardFlowIntegrationTest(TestCase):
         )
         
         Skill.objects.create(
-            resume=self.resume,
+            resume=cls.resume,
             name='Python',
             category='Programming'
         )
@@ -321,7 +326,7 @@ class AnalyticsDashboardFlowIntegrationTest(TestCase):
         scores = [60.0, 65.0, 70.0, 75.0, 80.0]
         for i, score in enumerate(scores):
             ResumeAnalysis.objects.create(
-                resume=self.resume,
+                resume=cls.resume,
                 job_description='Test job description',
                 keyword_match_score=score,
                 skill_relevance_score=score,
@@ -336,16 +341,17 @@ class AnalyticsDashboardFlowIntegrationTest(TestCase):
         
         # Create optimization history
         OptimizationHistory.objects.create(
-            resume=self.resume,
+            resume=cls.resume,
             job_description='Test job',
             original_score=70.0,
             optimized_score=85.0,
             improvement_delta=15.0
         )
-        
+    
+    def setUp(self):
         # Login
         self.client = Client()
-        self.client.login(username='testuser', password='testpass123')
+        self.client.force_login(self.user)
     
     def test_complete_analytics_dashboard_flow(self):
         """Test complete analytics dashboard workflow"""
@@ -410,7 +416,7 @@ class AnalyticsDashboardFlowIntegrationTest(TestCase):
         
         # Login as new user
         self.client.logout()
-        self.client.login(username='newuser', password='testpass123')
+        self.client.force_login(new_user)
         
         # Access dashboard
         url = reverse('analytics_dashboard')
@@ -427,36 +433,38 @@ class AnalyticsDashboardFlowIntegrationTest(TestCase):
 class CrossModuleIntegrationTest(TestCase):
     """Test integration between multiple modules"""
     
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data"""
-        self.user = User.objects.create_user(
+        cls.user = User.objects.create_user(
             username='testuser',
             password='testpass123'
         )
         
-        self.resume = Resume.objects.create(
-            user=self.user,
+        cls.resume = Resume.objects.create(
+            user=cls.user,
             title='Test Resume',
             template='professional'
         )
         
         PersonalInfo.objects.create(
-            resume=self.resume,
+            resume=cls.resume,
             full_name='John Doe',
             email='john@example.com'
         )
         
         Experience.objects.create(
-            resume=self.resume,
+            resume=cls.resume,
             company='Tech Corp',
             role='Developer',
             start_date=date(2020, 1, 1),
             description='Worked on projects',
             order=0
         )
-        
+    
+    def setUp(self):
         self.client = Client()
-        self.client.login(username='testuser', password='testpass123')
+        self.client.force_login(self.user)
     
     def test_optimization_creates_version_and_analysis(self):
         """Test that optimization creates both version and analysis records"""
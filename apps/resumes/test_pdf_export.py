@@ -1,80 +1,52 @@
 """
 Tests for PDF export functionality.
 """
+from unittest.mock import patch
 from django.test import TestCase
 from django.contrib.auth.models import User
-from datetime import date
-from .models import Resume, PersonalInfo, Experience, Education, Skill, Project
+from django.urls import reverse
+from .models import Resume, ResumeVersion, PersonalInfo
+from .testing import build_full_resume
 from .pdf_service import PDFExportService
 
 
 class PDFExportServiceTest(TestCase):
     """Test PDF export service functionality."""
     
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data."""
         # Create test user
-        self.user = User.objects.create_user(
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpass123'
         )
         
         # Create test resume with all sections
-        self.resume = Resume.objects.create(
-            user=self.user,
-            title='Test Resume',
-            template='professional'
-        )
-        
-        # Add personal info
-        PersonalInfo.objects.create(
-            resume=self.resume,
-            full_name='John Doe',
-            phone='555-1234',
-            email='john@example.com',
-            linkedin='https://linkedin.com/in/johndoe',
-            github='https://github.com/johndoe',
-            location='New York, NY'
-        )
-        
-        # Add experience
-        Experience.objects.create(
-            resume=self.resume,
-            company='Tech Corp',
-            role='Software Engineer',
-            start_date=date(2020, 1, 1),
-            end_date=date(2023, 12, 31),
-            description='Developed web applications',
-            order=0
+        cls.resume = build_full_resume(
+            cls.user,
+            personal_info={
+                'linkedin': 'https://linkedin.com/in/johndoe',
+                'github': 'https://github.com/johndoe',
+            },
+            project={'url': 'https://github.com/test'},
         )
         
-        # Add education
-        Education.objects.create(
-            resume=self.resume,
-            institution='University',
-            degree='Bachelor of Science',
-            field='Computer Science',
-            start_year=2016,
-            end_year=2020,
-            order=0
-        )
-        
-        # Add skill
-        Skill.objects.create(
-            resume=self.resume,
-            name='Python',
-            category='Technical'
+        # Create minimal resume with only personal info
+        cls.minimal_resume = Resume.objects.create(
+            user=cls.user,
+            title='Minimal Resume',
+            template='professional'
         )
-        
-        # Add project
-        Project.objects.create(
-            resume=self.resume,
-            name='Test Project',
-            description='A test project',
-            technologies='Python, Django',
-            url='https://github.com/test',
-            order=0
+        PersonalInfo.objects.create(
+            resume=cls.minimal_resume,
+            full_name='Jane Smith',
+            email='jane@example.com',
+            phone='',
+            linkedin='',
+            github='',
+            location=''
         )
     
     def test_render_resume_html(self):
@@ -105,27 +77,72 @@ class PDFExportServiceTest(TestCase):
     
     def test_generate_pdf_with_minimal_data(self):
         """Test PDF generation with minimal resume data."""
-        # Create minimal resume
-        minimal_resume = Resume.objects.create(
-            user=self.user,
-            title='Minimal Resume',
-            template='professional'
-        )
-        
-        # Add only personal info
-        PersonalInfo.objects.create(
-            resume=minimal_resume,
-            full_name='Jane Smith',
-            email='jane@example.com',
-            phone='',
-            linkedin='',
-            github='',
-            location=''
-        )
-        
         # Generate PDF
-        pdf_bytes, resume = PDFExportService.generate_pdf(minimal_resume.id)
+        pdf_bytes, resume = PDFExportService.generate_pdf(self.minimal_resume.id)
         
         # Check that PDF is generated successfully
         self.assertIsNotNone(pdf_bytes)
         self.assertTrue(pdf_bytes.startswith(b'%PDF'))
+
+
+def _stub_generate_pdf(resume_id, version_id=None):
+    """Stand-in for PDFExportService.generate_pdf that skips rendering."""
+    return b'%PDF-1.4\nstub', Resume.objects.get(id=resume_id)
+
+
+@patch('apps.resumes.pdf_service.PDFExportService.generate_pdf', side_effect=_stub_generate_pdf)
+class PDFExportViewTest(TestCase):
+    """
+    Test the export view's response headers.
+    
+    The renderer is stubbed: these tests only check what the view wraps
+    around the PDF bytes. PDFExportServiceTest exercises the real renderer.
+    """
+    
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data."""
+        cls.user = User.objects.create_user(
+            username='exportuser',
+            password='testpass123'
+        )
+        cls.resume = Resume.objects.create(
+            user=cls.user,
+            title='Export Resume',
+            template='professional'
+        )
+        cls.version = ResumeVersion.objects.create(
+            resume=cls.resume,
+            version_number=2,
+            snapshot_data={'title': 'Export Resume'}
+        )
+    
+    def setUp(self):
+        self.client.force_login(self.user)
+    
+    def test_export_returns_pdf_attachment(self, mock_generate):
+        """Test export responds with a PDF attachment named after the resume."""
+        response = self.client.get(reverse('resume_export', kwargs={'pk': self.resume.id}))
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/pdf')
+        self.assertEqual(
+            response['Content-Disposition'],
+            'attachment; filename="Export_Resume.pdf"'
+        )
+        self.assertGreater(len(response.content), 0)
+        mock_generate.assert_called_once_with(self.resume.id, version_id=None)
+    
+    def test_export_version_adds_version_to_filename(self, mock_generate):
+        """Test exporting a specific version suffixes the filename."""
+        response = self.client.get(
+            reverse('resume_export', kwargs={'pk': self.resume.id}),
+            {'version': self.version.id}
+        )
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/pdf')
+        self.assertEqual(
+            response['Content-Disposition'],
+            'attachment; filename="Export_Resume_v2.pdf"'
+        )
@@ -10,25 +10,37 @@ Tests performance requirements:
 - Response times
 """
 
-from django.test import TestCase, TransactionTestCase
+from django.test import TestCase, TransactionTestCase, tag
+from django.test.utils import CaptureQueriesContext
+from django.db import connection
 from django.contrib.auth.models import User
+from django.db import transaction
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.urls import reverse
-from apps.resumes.models import Resume, ResumeVersion
+from apps.resumes.models import (
+    Resume, ResumeVersion, PersonalInfo, Experience, Education, Skill, Project
+)
 from apps.resumes.services.pdf_parser import PDFParserService
 import time
 import io
+import re
+from collections import Counter
+from contextlib import contextmanager
+from datetime import date
 
 
 class LargePDFPerformanceTest(TestCase):
     """Test performance with large PDF files"""
     
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='perfuser',
             password='testpass123'
         )
-        self.client.login(username='perfuser', password='testpass123')
+    
+    def setUp(self):
+        self.client.force_login(self.user)
     
     def test_large_pdf_parsing_performance(self):
         """Test that large PDFs (up to 10MB) are parsed within acceptable time"""
@@ -58,19 +70,23 @@ class LargePDFPerformanceTest(TestCase):
 class ManyVersionsPerformanceTest(TestCase):
     """Test performance with many resume versions"""
     
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='versionuser',
             password='testpass123'
         )
-        self.client.login(username='versionuser', password='testpass123')
         
         # Create resume
-        self.resume = Resume.objects.create(
-            user=self.user,
+        cls.resume = Resume.objects.create(
+            user=cls.user,
             title="Test Resume"
         )
     
+    def setUp(self):
+        self.client.force_login(self.user)
+    
+    @tag('slow')
     def test_create_many_versions_performance(self):
         """Test creating 100+ versions completes in reasonable time"""
         start_time = time.time()
@@ -97,12 +113,14 @@ class ManyVersionsPerformanceTest(TestCase):
     def test_query_many_versions_performance(self):
         """Test querying resume with 100+ versions is fast"""
         # Create 100 versions
-        for i in range(100):
-            ResumeVersion.objects.create(
+        ResumeVersion.objects.bulk_create([
+            ResumeVersion(
                 resume=self.resume,
                 version_number=i + 1,
                 snapshot_data={'content': f"Version {i + 1} content"}
             )
+            for i in range(100)
+        ])
         
         start_time = time.time()
         
@@ -156,30 +174,53 @@ class ManyVersionsPerformanceTest(TestCase):
 class ResponseTimePerformanceTest(TestCase):
     """Test response times for common operations"""
     
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @contextmanager
+    def assertNoRepeatedQueries(self):
+        """
+        Fail if any query shape runs more than once inside the block.
+        
+        A fast machine can hide an N+1 lazy load under the time budget;
+        the same SELECT issued once per row cannot hide here.
+        """
+        with CaptureQueriesContext(connection) as ctx:
+            yield
+        shapes = Counter(
+            re.sub(r"'[^']*'|\b\d+\b", '?', query['sql'])
+            for query in ctx.captured_queries
+        )
+        repeated = {sql: n for sql, n in shapes.items() if n > 1}
+        self.assertFalse(repeated, f"Repeated queries (likely N+1): {repeated}")
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='responseuser',
             password='testpass123'
         )
-        self.client.login(username='responseuser', password='testpass123')
         
         # Create test data
-        self.resume = Resume.objects.create(
-            user=self.user,
+        cls.resume = Resume.objects.create(
+            user=cls.user,
             title="Test Resume"
         )
     
+    def setUp(self):
+        self.client.force_login(self.user)
+    
     def test_resume_list_response_time(self):
         """Test resume list loads within 500ms"""
         # Create 20 resumes
-        for i in range(20):
-            Resume.objects.create(
+        Resume.objects.bulk_create([
+            Resume(
                 user=self.user,
                 title=f"Resume {i}"
             )
+            for i in range(20)
+        ])
         
         start_time = time.time()
-        response = self.client.get(reverse('resume_list'))
+        with self.assertNoRepeatedQueries():
+            response = self.client.get(reverse('resume_list'))
         elapsed_time = time.time() - start_time
         
         self.assertEqual(response.status_code, 200)
@@ -189,15 +230,71 @@ class ResponseTimePerformanceTest(TestCase):
     def test_resume_detail_response_time(self):
         """Test resume detail loads within 500ms"""
         start_time = time.time()
-        response = self.client.get(
-            reverse('resume_detail', kwargs={'pk': self.resume.id})
-        )
+        with self.assertNoRepeatedQueries():
+            response = self.client.get(
+                reverse('resume_detail', kwargs={'pk': self.resume.id})
+            )
         elapsed_time = time.time() - start_time
         
         self.assertEqual(response.status_code, 200)
         self.assertLess(elapsed_time, 0.5,
                        f"Resume detail took {elapsed_time:.3f}s, expected < 0.5s")
     
+    def test_resume_detail_query_count(self):
+        """Test resume detail query count does not grow with section sizes"""
+        PersonalInfo.objects.create(
+            resume=self.resume,
+            full_name="Query Count",
+            email="count@example.com",
+            phone="555-0100",
+            location="Remote"
+        )
+        Experience.objects.bulk_create([
+            Experience(
+                resume=self.resume,
+                company=f"Company {i}",
+                role=f"Role {i}",
+                start_date=date(2015, 1, 1),
+                description="Built things",
+                order=i
+            )
+            for i in range(15)
+        ])
+        Education.objects.bulk_create([
+            Education(
+                resume=self.resume,
+                institution=f"University {i}",
+                degree="BSc",
+                field="Computer Science",
+                start_year=2010,
+                order=i
+            )
+            for i in range(15)
+        ])
+        Skill.objects.bulk_create([
+            Skill(resume=self.resume, name=f"Skill {i}", category="Technical")
+            for i in range(15)
+        ])
+        Project.objects.bulk_create([
+            Project(
+                resume=self.resume,
+                name=f"Project {i}",
+                description="Side project",
+                technologies="Python",
+                order=i
+            )
+            for i in range(15)
+        ])
+        
+        # Session + user, resume joined with owner and personal info, one
+        # prefetch per list section, session save
+        with self.assertNumQueries(11):
+            response = self.client.get(
+                reverse('resume_detail', kwargs={'pk': self.resume.id})
+            )
+        
+        self.assertEqual(response.status_code, 200)
+    
     def test_optimization_response_time(self):
         """Test optimization page loads within 1 second"""
         start_time = time.time()
@@ -211,24 +308,28 @@ class ResponseTimePerformanceTest(TestCase):
                        f"Optimization page took {elapsed_time:.3f}s, expected < 1s")
 
 
+@tag('slow')
 class ConcurrentUsersPerformanceTest(TransactionTestCase):
     """Test performance with concurrent users"""
     
     def setUp(self):
-        # Create multiple users
-        self.users = []
-        for i in range(10):
-            user = User.objects.create_user(
-                username=f'user{i}',
-                password='testpass123'
-            )
-            self.users.append(user)
-            
-            # Create resume for each user
-            Resume.objects.create(
-                user=user,
-                title=f"Resume {i}"
-            )
+        # TransactionTestCase runs in autocommit mode: commit the 20 fixture
+        # rows once, before the worker threads start reading them
+        with transaction.atomic():
+            # Create multiple users
+            self.users = []
+            for i in range(10):
+                user = User.objects.create_user(
+                    username=f'user{i}',
+                    password='testpass123'
+                )
+                self.users.append(user)
+                
+                # Create resume for each user
+                Resume.objects.create(
+                    user=user,
+                    title=f"Resume {i}"
+                )
     
     def test_concurrent_resume_access(self):
         """Test multiple users accessing resumes simultaneously"""
@@ -240,7 +341,7 @@ class ConcurrentUsersPerformanceTest(TransactionTestCase):
             """Simulate user accessing their resume"""
             from django.test import Client
             client = Client()
-            client.login(username=user.username, password='testpass123')
+            client.force_login(user)
             
             start = time.time()
             resume = Resume.objects.filter(user=user).first()
@@ -332,28 +433,32 @@ class ConcurrentUsersPerformanceTest(TransactionTestCase):
 class DatabaseQueryPerformanceTest(TestCase):
     """Test database query performance"""
     
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='dbuser',
             password='testpass123'
         )
         
-        # Create test data
-        self.resumes = []
-        for i in range(50):
-            resume = Resume.objects.create(
-                user=self.user,
+        # Create test data: one multi-row INSERT per table
+        cls.resumes = Resume.objects.bulk_create([
+            Resume(
+                user=cls.user,
                 title=f"Resume {i}"
             )
-            self.resumes.append(resume)
-            
-            # Create 10 versions for each resume
-            for j in range(10):
-                ResumeVersion.objects.create(
-                    resume=resume,
-                    version_number=j + 1,
-                    snapshot_data={'content': f"Version {j + 1} content"}
-                )
+            for i in range(50)
+        ])
+        
+        # Create 10 versions for each resume
+        ResumeVersion.objects.bulk_create([
+            ResumeVersion(
+                resume=resume,
+                version_number=j + 1,
+                snapshot_data={'content': f"Version {j + 1} content"}
+            )
+            for resume in cls.resumes
+            for j in range(10)
+        ])
     
     def test_bulk_query_performance(self):
         """Test querying all user resumes with versions is efficient"""
@@ -397,3 +502,14 @@ class DatabaseQueryPerformanceTest(TestCase):
                        f"Filtered query took {elapsed_time:.3f}s, expected < 0.1s")
         
         self.assertGreater(result_count, 0)
+    
+    def test_resume_list_query_count(self):
+        """Test resume list query count does not grow with the number of resumes"""
+        self.client.force_login(self.user)
+        
+        # Session + user, paginator count, one page of resumes, their skills,
+        # session save
+        with self.assertNumQueries(8):
+            response = self.client.get(reverse('resume_list'))
+        
+        self.assertEqual(response.status_code, 200)
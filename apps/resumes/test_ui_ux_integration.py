@@ -8,6 +8,7 @@ Tests end-to-end flows for:
 """
 from django.test import TestCase, Client
 from django.contrib.auth.models import User
+from django.contrib.messages import get_messages
 from django.urls import reverse
 from django.utils import timezone
 from apps.resumes.models import (
@@ -159,12 +160,9 @@ class ResumeCreationFlowIntegrationTest(TestCase):
         self.assertIn('Django', skill_names)
         
         # Requirement 5.3: Verify success message displays
-        # Follow the redirect to check messages
-        response = self.client.get(response.url)
-        self.assertEqual(response.status_code, 200)
-        
-        # Check that success message was added to messages framework
-        messages = list(response.context['messages'])
+        # Read the messages framework straight off the finishing request
+        # rather than rendering the whole detail page to reach them
+        messages = list(get_messages(response.wsgi_request))
         # There will be multiple messages from adding items in steps, check the last one
         self.assertGreater(len(messages), 0)
         # The final message should be the resume creation success
@@ -3,7 +3,7 @@ Tests for XSS protection in forms.
 
 Validates: Requirements 14.4
 """
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 from django.contrib.auth.models import User
 from apps.resumes.forms import (
     ResumeForm, PersonalInfoForm, ExperienceForm,
@@ -14,21 +14,13 @@ from apps.analyzer.forms import JobDescriptionForm
 from datetime import date
 
 
-class XSSProtectionTestCase(TestCase):
-    """Test XSS protection across all forms."""
+class XSSProtectionTestCase(SimpleTestCase):
+    """
+    Test XSS protection across all forms.
     
-    def setUp(self):
-        """Set up test user and resume."""
-        self.user = User.objects.create_user(
-            username='testuser',
-            email='test@example.com',
-            password='testpass123'
-        )
-        self.resume = Resume.objects.create(
-            user=self.user,
-            title='Test Resume',
-            template='professional'
-        )
+    Sanitization happens in the forms' clean methods, so these cases run
+    without a database; forms whose validation queries it live below.
+    """
     
     def test_resume_form_xss_protection(self):
         """Test that ResumeForm sanitizes XSS payloads in title."""
@@ -95,20 +87,6 @@ class XSSProtectionTestCase(TestCase):
         self.assertNotIn('<iframe', cleaned_institution)
         self.assertIn('MIT', cleaned_institution)
     
-    def test_skill_form_xss_protection(self):
-        """Test that SkillForm sanitizes XSS payloads."""
-        xss_payload = '<svg onload=alert("XSS")>Python'
-        form = SkillForm(data={
-            'name': xss_payload,
-            'category': 'Technical'
-        }, resume=self.resume)
-        
-        self.assertTrue(form.is_valid())
-        cleaned_name = form.cleaned_data['name']
-        # SVG tags should be escaped or removed
-        self.assertNotIn('<svg', cleaned_name)  # Tag should be escaped
-        self.assertIn('Python', cleaned_name)
-    
     def test_project_form_xss_protection(self):
         """Test that ProjectForm sanitizes XSS payloads."""
         xss_payload = '<script>document.cookie</script>My Project'
@@ -168,3 +146,34 @@ class XSSProtectionTestCase(TestCase):
                 self.assertNotIn('<iframe', cleaned_title)
                 self.assertNotIn('<body', cleaned_title)
                 self.assertNotIn('<input', cleaned_title)
+
+
+class SkillFormXSSProtectionTest(TestCase):
+    """Test XSS protection in SkillForm, whose duplicate check queries the resume's skills."""
+    
+    def setUp(self):
+        """Set up test user and resume."""
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.resume = Resume.objects.create(
+            user=self.user,
+            title='Test Resume',
+            template='professional'
+        )
+    
+    def test_skill_form_xss_protection(self):
+        """Test that SkillForm sanitizes XSS payloads."""
+        xss_payload = '<svg onload=alert("XSS")>Python'
+        form = SkillForm(data={
+            'name': xss_payload,
+            'category': 'Technical'
+        }, resume=self.resume)
+        
+        self.assertTrue(form.is_valid())
+        cleaned_name = form.cleaned_data['name']
+        # SVG tags should be escaped or removed
+        self.assertNotIn('<svg', cleaned_name)  # Tag should be escaped
+        self.assertIn('Python', cleaned_name)
@@ -0,0 +1,73 @@
+"""
+Shared fixture builders for resume tests.
+"""
+from datetime import date
+
+from apps.resumes.models import Resume, PersonalInfo, Experience, Education, Skill, Project
+from apps.resumes.signals import refresh_completeness
+
+
+def build_full_resume(user, title='Test Resume', template='professional', *,
+                      personal_info=None, experience=None, education=None,
+                      skill=None, project=None):
+    """
+    Create a resume with one row in every section.
+
+    Each keyword argument overrides fields of the matching section's default
+    row, e.g. ``experience={'description': 'Worked on things'}``.
+
+    Sections are inserted with bulk_create, which skips the per-row post_save
+    signals, so completeness is refreshed once at the end instead.
+
+    Args:
+        user: Owner of the resume
+        title: Resume title
+        template: Resume template name
+        personal_info, experience, education, skill, project: Optional dicts
+            of field overrides for that section
+
+    Returns:
+        Resume: The created resume
+    """
+    resume = Resume.objects.create(user=user, title=title, template=template)
+
+    PersonalInfo.objects.bulk_create([PersonalInfo(resume=resume, **{
+        'full_name': 'John Doe',
+        'phone': '555-1234',
+        'email': 'john@example.com',
+        'location': 'New York, NY',
+        **(personal_info or {}),
+    })])
+    Experience.objects.bulk_create([Experience(resume=resume, **{
+        'company': 'Tech Corp',
+        'role': 'Software Engineer',
+        'start_date': date(2020, 1, 1),
+        'end_date': date(2023, 12, 31),
+        'description': 'Developed web applications',
+        'order': 0,
+        **(experience or {}),
+    })])
+    Education.objects.bulk_create([Education(resume=resume, **{
+        'institution': 'University',
+        'degree': 'BS',
+        'field': 'Computer Science',
+        'start_year': 2016,
+        'end_year': 2020,
+        'order': 0,
+        **(education or {}),
+    })])
+    Skill.objects.bulk_create([Skill(resume=resume, **{
+        'name': 'Python',
+        'category': 'Programming',
+        **(skill or {}),
+    })])
+    Project.objects.bulk_create([Project(resume=resume, **{
+        'name': 'Test Project',
+        'description': 'A test project',
+        'technologies': 'Python, Django',
+        'order': 0,
+        **(project or {}),
+    })])
+
+    refresh_completeness(resume.id)
+    return resume
@@ -2,7 +2,7 @@ from django.test import TestCase, Client
 from django.contrib.auth.models import User
 from django.urls import reverse
 from datetime import date
-from .models import Resume, Experience
+from .models import Resume, Experience, ResumeAnalysis
 from .forms import ExperienceForm
 
 
@@ -195,3 +195,50 @@ class ExperienceViewTests(TestCase):
         url = reverse('experience_add', kwargs={'resume_pk': other_resume.id})
         response = self.client.get(url)
         self.assertEqual(response.status_code, 403)  # Forbidden
+
+
+class ResumeAnalysisJobDescriptionHashTests(TestCase):
+    """Tests for the indexed job description digest on ResumeAnalysis."""
+
+    def setUp(self):
+        user = User.objects.create_user(username='hashuser', password='testpass123')
+        self.resume = Resume.objects.create(user=user, title='Hash Resume', template='professional')
+
+    def _upsert(self, job_description, score):
+        return ResumeAnalysis.objects.update_or_create(
+            resume=self.resume,
+            job_description_hash=ResumeAnalysis.hash_job_description(job_description),
+            defaults={
+                'job_description': job_description,
+                'keyword_match_score': score,
+                'skill_relevance_score': score,
+                'section_completeness_score': score,
+                'experience_impact_score': score,
+                'quantification_score': score,
+                'action_verb_score': score,
+                'final_score': score,
+            },
+        )
+
+    def test_long_job_description_upserts_on_digest(self):
+        """A 10,000 character job description is stored and matched by its digest."""
+        job_description = 'Python Django engineer. ' * 417
+        analysis, created = self._upsert(job_description, 60.0)
+        self.assertTrue(created)
+        self.assertEqual(len(analysis.job_description_hash), 32)
+
+        analysis, created = self._upsert(job_description, 75.0)
+        self.assertFalse(created)
+        self.assertEqual(ResumeAnalysis.objects.filter(resume=self.resume).count(), 1)
+        self.assertEqual(analysis.final_score, 75.0)
+
+    def test_save_keeps_digest_in_sync(self):
+        """Editing job_description through save() refreshes the digest."""
+        analysis, _ = self._upsert('Original description', 50.0)
+        analysis.job_description = 'Edited description'
+        analysis.save(update_fields=['job_description'])
+        analysis.refresh_from_db()
+        self.assertEqual(
+            analysis.job_description_hash,
+            ResumeAnalysis.hash_job_description('Edited description'),
+        )
@@ -1,6 +1,6 @@
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
-from django.http import HttpResponse, HttpResponseForbidden
+from django.http import HttpResponse, HttpResponseForbidden, JsonResponse
 from django.contrib import messages
 from django.db import models, transaction
 from django.utils import timezone
@@ -20,7 +20,9 @@ logger = logging.getLogger(__name__)
 def resume_list(request):
     from django.core.paginator import Paginator
 
-    all_resumes = ResumeService.get_user_resumes(request.user)
+    # Each card shows its top skills; prefetch them for the current page in
+    # one query instead of one per card
+    all_resumes = ResumeService.get_user_resumes(request.user).prefetch_related('skills')
 
     paginator = Paginator(all_resumes, 12)
     page_obj = paginator.get_page(request.GET.get('page'))
@@ -214,11 +216,13 @@ def resume_create(request):
                             request.user, 'resume_created',
                             f'Created resume "{resume.title}"', resume=resume
                         )
+                        # Section sizes come from the submitted wizard data;
+                        # no need to COUNT rows that were just inserted
                         logger.info(
                             f'Resume created: ID={resume.id}, '
-                            f'Experiences={resume.experiences.count()}, '
-                            f'Education={resume.education.count()}, '
-                            f'Skills={resume.skills.count()}'
+                            f'Experiences={len(wizard_data["data"].get("experiences", []))}, '
+                            f'Education={len(wizard_data["data"].get("education", []))}, '
+                            f'Skills={len(wizard_data["data"].get("skills", []))}'
                         )
 
                         # Clear wizard session only on success
@@ -252,7 +256,6 @@ def resume_create(request):
     # Handle AJAX requests for autosave and AI generation
     if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
         import json
-        from django.http import JsonResponse
         from django.template.loader import render_to_string
         
         # Handle real-time preview updates
@@ -449,10 +452,10 @@ def resume_detail(request, pk):
     Render resume using selected template.
     Verify resume belongs to authenticated user.
     """
-    # Optimize query with prefetch_related to reduce database hits
+    # Join the owner (authorization check) and personal info, prefetch the
+    # list sections: a fixed query count regardless of section sizes
     resume = get_object_or_404(
-        Resume.objects.prefetch_related(
-            'personal_info',
+        Resume.objects.select_related('user', 'personal_info').prefetch_related(
             'experiences',
             'education',
             'skills',
@@ -495,10 +498,10 @@ def resume_update(request, pk):
     Update existing resume with all sections.
     Load existing data and allow editing.
     """
-    # Optimize query with prefetch_related to reduce database hits
+    # Join the owner (authorization check) and personal info, prefetch the
+    # list sections: a fixed query count regardless of section sizes
     resume = get_object_or_404(
-        Resume.objects.prefetch_related(
-            'personal_info',
+        Resume.objects.select_related('user', 'personal_info').prefetch_related(
             'experiences',
             'education',
             'skills',
@@ -827,10 +830,11 @@ def batch_export(request):
         messages.error(request, 'Please select at least one resume to export.')
         return redirect('resume_list')
     
-    # Validate that all resumes belong to the user
-    resumes = Resume.objects.filter(id__in=resume_ids, user=request.user)
+    # Validate that all resumes belong to the user (fetched once: the rows are
+    # needed for the export anyway, so no separate COUNT query)
+    resumes = list(Resume.objects.filter(id__in=resume_ids, user=request.user))
     
-    if resumes.count() != len(resume_ids):
+    if len(resumes) != len(resume_ids):
         messages.error(request, 'Some selected resumes do not exist or do not belong to you.')
         return redirect('resume_list')
     
@@ -884,12 +888,12 @@ def batch_export(request):
         else:
             messages.success(
                 request,
-                f'Successfully exported {resumes.count()} resume(s) in {export_format} format.'
+                f'Successfully exported {len(resumes)} resume(s) in {export_format} format.'
             )
         
         logger.info(
             f'Batch export completed for user {request.user.username}: '
-            f'{resumes.count()} resumes, format: {export_format}, '
+            f'{len(resumes)} resumes, format: {export_format}, '
             f'failures: {len(failed_exports)}'
         )
         
@@ -1034,8 +1038,10 @@ def batch_analysis(request):
             return redirect('resume_list')
     
     # GET request - show form
-    # Get user's resumes for selection
-    resumes = Resume.objects.filter(user=request.user).order_by('-updated_at')
+    # Get user's resumes for selection (only the columns the picker displays)
+    resumes = Resume.objects.filter(user=request.user).only(
+        'id', 'title', 'updated_at', 'current_version_number', 'latest_ats_score'
+    ).order_by('-updated_at')
     
     context = {
         'resumes': resumes,
@@ -1456,7 +1462,6 @@ def pdf_upload(request):
     Handle PDF resume upload with validation, rate limiting, and parsing.
     """
     # Rate limiting: max 5 uploads per hour per user
-    from django.utils import timezone
     from datetime import timedelta
     recent_uploads = UploadedResume.objects.filter(
         user=request.user,
@@ -2035,6 +2040,18 @@ def fix_preview(request, pk):
             )
             return redirect('resume_detail', pk=pk)
     
+    # Group changes by type for easier display, in a single pass
+    change_groups = {
+        'bullet_rewrite': [],
+        'keyword_injection': [],
+        'quantification_suggestion': [],
+        'formatting_standardization': [],
+    }
+    for change in optimization_results['detailed_changes']:
+        group = change_groups.get(change['type'])
+        if group is not None:
+            group.append(change)
+    
     # Prepare context for template
     context = {
         'resume': resume,
@@ -2046,12 +2063,10 @@ def fix_preview(request, pk):
         'detailed_changes': optimization_results['detailed_changes'],
         'optimized_data': optimization_results['optimized_data'],
         'original_analysis': optimization_results.get('original_analysis', {}),
-        
-        # Group changes by type for easier display
-        'bullet_changes': [c for c in optimization_results['detailed_changes'] if c['type'] == 'bullet_rewrite'],
-        'keyword_changes': [c for c in optimization_results['detailed_changes'] if c['type'] == 'keyword_injection'],
-        'quantification_changes': [c for c in optimization_results['detailed_changes'] if c['type'] == 'quantification_suggestion'],
-        'formatting_changes': [c for c in optimization_results['detailed_changes'] if c['type'] == 'formatting_standardization'],
+        'bullet_changes': change_groups['bullet_rewrite'],
+        'keyword_changes': change_groups['keyword_injection'],
+        'quantification_changes': change_groups['quantification_suggestion'],
+        'formatting_changes': change_groups['formatting_standardization'],
     }
     
     return render(request, 'resumes/fix_comparison.html', context)
@@ -2516,7 +2531,7 @@ def optimization_history_list(request, pk):
     
     logger.info(
         f'Displaying optimization history for resume {pk}: '
-        f'{optimizations.count()} total sessions'
+        f'{paginator.count} total sessions'
     )
     
     context = {
@@ -2632,8 +2647,8 @@ def version_list(request, pk):
     """
     from .services.version_service import VersionService
     
-    # Load resume
-    resume = get_object_or_404(Resume, id=pk)
+    # Load resume (with owner, used by the authorization check)
+    resume = get_object_or_404(Resume.objects.select_related('user'), id=pk)
     
     # Authorization check
     if resume.user != request.user:
@@ -2643,8 +2658,14 @@ def version_list(request, pk):
         )
         return HttpResponseForbidden("You do not have permission to view these versions.")
     
-    # Get all versions for this resume
-    versions = VersionService.get_version_history(resume)
+    # Get all versions for this resume. The list page only displays a few
+    # plain fields, so fetch them as dicts (no snapshot JSON, no model instances)
+    versions = list(
+        VersionService.get_version_history_qs(resume).values(
+            'id', 'version_number', 'modification_type', 'ats_score',
+            'created_at', 'user_notes',
+        )
+    )
     
     logger.info(
         f'Version history loaded for resume {pk} by user {request.user.username}: '
@@ -2674,8 +2695,8 @@ def version_detail(request, pk, version_id):
     """
     from .models import ResumeVersion
     
-    # Load resume
-    resume = get_object_or_404(Resume, id=pk)
+    # Load resume (with owner, used by the authorization check)
+    resume = get_object_or_404(Resume.objects.select_related('user'), id=pk)
     
     # Authorization check
     if resume.user != request.user:
@@ -2730,8 +2751,8 @@ def version_compare(request, pk):
     from .services.version_service import VersionService
     from .models import ResumeVersion
     
-    # Load resume
-    resume = get_object_or_404(Resume, id=pk)
+    # Load resume (with owner, used by the authorization check)
+    resume = get_object_or_404(Resume.objects.select_related('user'), id=pk)
     
     # Authorization check
     if resume.user != request.user:
@@ -2815,8 +2836,8 @@ def version_restore(request, pk, version_id):
         messages.error(request, 'Invalid request method.')
         return redirect('version_list', pk=pk)
     
-    # Load resume
-    resume = get_object_or_404(Resume, id=pk)
+    # Load resume (with owner, used by the authorization check)
+    resume = get_object_or_404(Resume.objects.select_related('user'), id=pk)
     
     # Authorization check
     if resume.user != request.user:
@@ -2917,7 +2938,6 @@ def customize_template(request, pk):
             
             # Check if this is an AJAX request for preview
             if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-                from django.http import JsonResponse
                 return JsonResponse({
                     'success': True,
                     'message': 'Customization applied',
@@ -2931,7 +2951,6 @@ def customize_template(request, pk):
             messages.error(request, f'Failed to apply customization: {str(e)}')
             
             if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-                from django.http import JsonResponse
                 return JsonResponse({
                     'success': False,
                     'error': str(e)
@@ -3003,7 +3022,6 @@ def fix_resume_async(request, pk):
     Async version of fix_resume — queues optimization as a Celery task
     and returns a task_id for SSE progress tracking.
     """
-    from django.http import JsonResponse
     resume = get_object_or_404(Resume, id=pk)
 
     if resume.user != request.user:
@@ -3033,7 +3051,6 @@ def pdf_upload_async(request):
     Async PDF upload — saves file and queues parsing as a Celery task.
     Returns task_id for SSE progress tracking.
     """
-    from django.http import JsonResponse
     from .utils.file_validators import validate_pdf_file, has_embedded_scripts
     from .models import UploadedResume
 
@@ -3090,7 +3107,6 @@ def ats_simulate(request, pk):
     Show ATS system simulation results for a resume.
     Simulates Taleo, Workday, Greenhouse, Lever, and iCIMS.
     """
-    from django.http import JsonResponse
     resume = get_object_or_404(Resume, id=pk)
 
     if resume.user != request.user:
@@ -3123,7 +3139,6 @@ def linkedin_import(request):
     """
     Import a LinkedIn profile and pre-fill the resume creation wizard.
     """
-    from django.http import JsonResponse
 
     if request.method == 'POST':
         url = request.POST.get('linkedin_url', '').strip()
@@ -3176,7 +3191,6 @@ def generate_summary_ai(request):
     AJAX endpoint: generate a professional summary using LLM.
     Rate limited to 20/hour per user.
     """
-    from django.http import JsonResponse
     import json
 
     if request.method != 'POST':
@@ -3223,7 +3237,6 @@ def rejection_analysis_resume(request, pk):
     AI-powered analysis of why a resume may have been rejected for a specific role.
     Rate limited to 20/hour per user to protect OpenAI API key.
     """
-    from django.http import JsonResponse
     try:
         from ratelimit.decorators import ratelimit as _rl
         # Apply inline rate limit check
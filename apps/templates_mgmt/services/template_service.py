@@ -2,9 +2,85 @@
 Template Service
 Handles template CRUD operations and preview generation.
 """
+from datetime import date
+
 from django.template.loader import render_to_string
 from apps.templates_mgmt.models import ResumeTemplate
 from apps.resumes.models import Resume
+from apps.resumes.services.snapshot_utils import (
+    TempResume, TempPersonalInfo, TempExperience, TempEducation, TempSkill, TempProject
+)
+
+
+def _build_sample_data():
+    """Build the preview context once; templates only read from it."""
+    resume = TempResume()
+    resume.title = 'Sample Resume'
+    resume.summary = 'Experienced professional with expertise in software development and a proven track record of delivering high-quality solutions. Passionate about creating efficient, scalable applications and mentoring team members.'
+    
+    return {
+        'resume': resume,
+        'personal_info': TempPersonalInfo(
+            full_name='John Doe',
+            email='john.doe@email.com',
+            phone='(555) 123-4567',
+            location='San Francisco, CA',
+            linkedin='linkedin.com/in/johndoe',
+            github='github.com/johndoe'
+        ),
+        'experiences': [
+            TempExperience(
+                role='Senior Software Engineer',
+                company='Tech Company Inc.',
+                start_date=date(2021, 1, 1),
+                end_date=None,
+                description='Led development of scalable web applications using Python and Django. Implemented CI/CD pipelines and improved system performance by 40%. Mentored junior developers and conducted code reviews.'
+            ),
+            TempExperience(
+                role='Software Engineer',
+                company='Startup Solutions',
+                start_date=date(2019, 6, 1),
+                end_date=date(2020, 12, 31),
+                description='Developed RESTful APIs and microservices. Collaborated with cross-functional teams to deliver features on time. Reduced API response time by 30% through optimization.'
+            )
+        ],
+        'education': [
+            TempEducation(
+                degree='Bachelor of Science',
+                field='Computer Science',
+                institution='University of California',
+                start_year=2015,
+                end_year=2019
+            )
+        ],
+        'skills': [
+            TempSkill(name='Python', category='Programming Languages'),
+            TempSkill(name='JavaScript', category='Programming Languages'),
+            TempSkill(name='Django', category='Frameworks'),
+            TempSkill(name='React', category='Frameworks'),
+            TempSkill(name='PostgreSQL', category='Databases'),
+            TempSkill(name='Docker', category='Tools'),
+            TempSkill(name='Git', category='Tools')
+        ],
+        'projects': [
+            TempProject(
+                name='E-commerce Platform',
+                url='github.com/johndoe/ecommerce',
+                description='Built a full-stack e-commerce platform with payment integration and inventory management.',
+                technologies='Django, React, PostgreSQL, Stripe API'
+            ),
+            TempProject(
+                name='Task Management App',
+                url='github.com/johndoe/taskapp',
+                description='Developed a collaborative task management application with real-time updates.',
+                technologies='Node.js, Socket.io, MongoDB'
+            )
+        ]
+    }
+
+
+# Sample data for previews, using the same slotted holders as version snapshots
+_SAMPLE_DATA = _build_sample_data()
 
 
 class TemplateService:
@@ -62,73 +138,9 @@ class TemplateService:
             logger.error(f"Template {template.id} has no template_file set")
             raise ValueError("Template file path is not configured")
         
-        # Sample data for preview - convert dictionaries to mock objects with attributes
-        sample_data = {
-            'resume': type('obj', (object,), {
-                'title': 'Sample Resume',
-                'summary': 'Experienced professional with expertise in software development and a proven track record of delivering high-quality solutions. Passionate about creating efficient, scalable applications and mentoring team members.'
-            })(),
-            'personal_info': type('obj', (object,), {
-                'full_name': 'John Doe',
-                'email': 'john.doe@email.com',
-                'phone': '(555) 123-4567',
-                'location': 'San Francisco, CA',
-                'linkedin': 'linkedin.com/in/johndoe',
-                'github': 'github.com/johndoe'
-            })(),
-            'experiences': [
-                type('obj', (object,), {
-                    'role': 'Senior Software Engineer',
-                    'company': 'Tech Company Inc.',
-                    'start_date': '2021-01-01',
-                    'end_date': None,
-                    'description': 'Led development of scalable web applications using Python and Django. Implemented CI/CD pipelines and improved system performance by 40%. Mentored junior developers and conducted code reviews.'
-                })(),
-                type('obj', (object,), {
-                    'role': 'Software Engineer',
-                    'company': 'Startup Solutions',
-                    'start_date': '2019-06-01',
-                    'end_date': '2020-12-31',
-                    'description': 'Developed RESTful APIs and microservices. Collaborated with cross-functional teams to deliver features on time. Reduced API response time by 30% through optimization.'
-                })()
-            ],
-            'education': [
-                type('obj', (object,), {
-                    'degree': 'Bachelor of Science',
-                    'field': 'Computer Science',
-                    'institution': 'University of California',
-                    'start_year': 2015,
-                    'end_year': 2019
-                })()
-            ],
-            'skills': [
-                type('obj', (object,), {'name': 'Python', 'category': 'Programming Languages'})(),
-                type('obj', (object,), {'name': 'JavaScript', 'category': 'Programming Languages'})(),
-                type('obj', (object,), {'name': 'Django', 'category': 'Frameworks'})(),
-                type('obj', (object,), {'name': 'React', 'category': 'Frameworks'})(),
-                type('obj', (object,), {'name': 'PostgreSQL', 'category': 'Databases'})(),
-                type('obj', (object,), {'name': 'Docker', 'category': 'Tools'})(),
-                type('obj', (object,), {'name': 'Git', 'category': 'Tools'})()
-            ],
-            'projects': [
-                type('obj', (object,), {
-                    'name': 'E-commerce Platform',
-                    'url': 'github.com/johndoe/ecommerce',
-                    'description': 'Built a full-stack e-commerce platform with payment integration and inventory management.',
-                    'technologies': 'Django, React, PostgreSQL, Stripe API'
-                })(),
-                type('obj', (object,), {
-                    'name': 'Task Management App',
-                    'url': 'github.com/johndoe/taskapp',
-                    'description': 'Developed a collaborative task management application with real-time updates.',
-                    'technologies': 'Node.js, Socket.io, MongoDB'
-                })()
-            ]
-        }
-        
         # Render the template with sample data
         try:
-            html = render_to_string(template.template_file, sample_data)
+            html = render_to_string(template.template_file, _SAMPLE_DATA)
             logger.info(f"Successfully rendered preview for template {template.id} ({template.name})")
             return html
         except TemplateDoesNotExist as e:
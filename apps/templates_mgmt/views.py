@@ -1,6 +1,9 @@
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Max
 from django.http import JsonResponse, HttpResponse
 from django.template.loader import render_to_string
 from apps.templates_mgmt.models import ResumeTemplate, TemplateCustomization
@@ -17,8 +20,14 @@ def template_gallery(request):
     """
     templates = TemplateService.get_all_templates()
     
+    # The cards are the same for every user and are fragment-cached in the
+    # template; key them on the template set so edits show up immediately
+    stats = templates.aggregate(total=Count('id'), latest=Max('updated_at'))
+    latest = stats['latest'].timestamp() if stats['latest'] else 0
+    
     context = {
         'templates': templates,
+        'gallery_version': f"{stats['total']}-{latest}",
         'page_title': 'Template Gallery'
     }
     
@@ -58,15 +67,27 @@ def template_preview(request, template_id):
         }, status=404)
     
     try:
-        # Generate preview HTML with sample data
-        preview_html = TemplateService.generate_preview_with_sample_data(template)
+        # Generate preview HTML with sample data (identical for every user,
+        # so reuse it until the template changes)
+        cache_key = f'template_preview_{template.id}_{template.updated_at.timestamp()}'
+        preview_html = cache.get(cache_key)
+        if preview_html is None:
+            preview_html = TemplateService.generate_preview_with_sample_data(template)
+            if preview_html and not preview_html.startswith("<p>Error"):
+                cache.set(
+                    cache_key,
+                    preview_html,
+                    getattr(settings, 'CACHE_TIMEOUT_TEMPLATE_PREVIEW', 3600)
+                )
         
         # Validate that HTML was generated successfully
         if not preview_html or preview_html.startswith("<p>Error"):
             raise ValueError("Template rendering failed")
         
         # Get user's resumes for selection
-        user_resumes = Resume.objects.filter(user=request.user).order_by('-updated_at')
+        user_resumes = Resume.objects.filter(user=request.user).only(
+            'id', 'title', 'updated_at'
+        ).order_by('-updated_at')
         
         context = {
             'template': template,
@@ -1,4 +1,5 @@
 import re
+from itertools import islice
 from apps.resumes.models import Resume
 
 
@@ -52,7 +53,7 @@ class InterviewPrepService:
         # 3. Technical questions from resume skills + JD keywords
         skills = list(resume.skills.values_list('name', flat=True)[:8])
         jd_skills = self._extract_tech_skills(job_description)
-        combined_skills = list(dict.fromkeys(jd_skills + skills))[:6]
+        combined_skills = list(islice(dict.fromkeys(jd_skills + skills), 6))
 
         for skill in combined_skills[:4]:
             template, cat = self.TECHNICAL_TEMPLATES[len(questions) % len(self.TECHNICAL_TEMPLATES)]
@@ -142,10 +142,8 @@ def main():
         print(f"Error: Main SCSS file not found: {INPUT_FILE}")
         sys.exit(1)
     
-    print("=" * 60)
-    print("NextGenCV Design System - SCSS Compiler")
-    print("=" * 60)
-    print()
+    rule = "=" * 60
+    print(f"{rule}\nNextGenCV Design System - SCSS Compiler\n{rule}\n")
     
     if args.watch:
         # Initial compilation
@@ -0,0 +1,19 @@
+"""
+Shared console output helpers for the asset management commands.
+
+Modules starting with an underscore are not picked up as commands.
+"""
+
+
+def write_section(command, title, width=70, style_func=None):
+    """
+    Write a section banner (rule, title, rule, blank line) in one write call.
+
+    Args:
+        command: BaseCommand instance whose stdout receives the banner
+        title: Section title
+        width: Width of the '=' rules
+        style_func: Optional style (e.g. command.style.SUCCESS)
+    """
+    rule = '=' * width
+    command.stdout.write(f'{rule}\n{title}\n{rule}\n\n', style_func=style_func)
@@ -12,6 +12,8 @@ from pathlib import Path
 import sys
 import time
 
+from ._output import write_section
+
 try:
     import sass
 except ImportError:
@@ -61,10 +63,7 @@ class Command(BaseCommand):
             )
             sys.exit(1)
 
-        self.stdout.write('=' * 60)
-        self.stdout.write('NextGenCV Design System - SCSS Compiler')
-        self.stdout.write('=' * 60)
-        self.stdout.write('')
+        write_section(self, 'NextGenCV Design System - SCSS Compiler', width=60)
 
         if options['watch']:
             # Initial compilation
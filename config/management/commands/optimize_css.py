@@ -18,6 +18,8 @@ from pathlib import Path
 from django.core.management.base import BaseCommand
 from django.conf import settings
 
+from ._output import write_section
+
 try:
     import sass
 except ImportError:
@@ -35,10 +37,7 @@ class Command(BaseCommand):
         )
 
     def handle(self, *args, **options):
-        self.stdout.write(self.style.SUCCESS('=' * 70))
-        self.stdout.write(self.style.SUCCESS('CSS Optimization for Production'))
-        self.stdout.write(self.style.SUCCESS('=' * 70))
-        self.stdout.write('')
+        write_section(self, 'CSS Optimization for Production', style_func=self.style.SUCCESS)
 
         if not sass:
             self.stdout.write(self.style.ERROR(
@@ -130,10 +129,7 @@ class Command(BaseCommand):
                 self.stdout.write(f'  Gzipped: {gzip_size:,} bytes ({compression_ratio:.1f}% reduction)')
         
         self.stdout.write('')
-        self.stdout.write(self.style.SUCCESS('=' * 70))
-        self.stdout.write(self.style.SUCCESS('CSS Optimization Complete'))
-        self.stdout.write(self.style.SUCCESS('=' * 70))
-        self.stdout.write('')
+        write_section(self, 'CSS Optimization Complete', style_func=self.style.SUCCESS)
         self.stdout.write('Next steps:')
         self.stdout.write('1. Run: python manage.py collectstatic')
         self.stdout.write('2. Configure your web server to serve .gz files when available')
@@ -20,6 +20,8 @@ from pathlib import Path
 from django.core.management.base import BaseCommand
 from django.conf import settings
 
+from ._output import write_section
+
 try:
     from PIL import Image
     PIL_AVAILABLE = True
@@ -56,10 +58,7 @@ class Command(BaseCommand):
             ))
             return
 
-        self.stdout.write(self.style.SUCCESS('=' * 70))
-        self.stdout.write(self.style.SUCCESS('Image Optimization for Production'))
-        self.stdout.write(self.style.SUCCESS('=' * 70))
-        self.stdout.write('')
+        write_section(self, 'Image Optimization for Production', style_func=self.style.SUCCESS)
 
         quality = options['quality']
         create_webp = options['webp']
@@ -168,10 +167,7 @@ class Command(BaseCommand):
             self.stdout.write('')
 
         # Summary
-        self.stdout.write(self.style.SUCCESS('=' * 70))
-        self.stdout.write(self.style.SUCCESS('Optimization Summary'))
-        self.stdout.write(self.style.SUCCESS('=' * 70))
-        self.stdout.write('')
+        write_section(self, 'Optimization Summary', style_func=self.style.SUCCESS)
         self.stdout.write(f'Total original size: {total_original_size:,} bytes ({total_original_size / 1024:.2f} KB)')
         self.stdout.write(f'Total optimized size: {total_optimized_size:,} bytes ({total_optimized_size / 1024:.2f} KB)')
 
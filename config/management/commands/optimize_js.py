@@ -21,6 +21,8 @@ from pathlib import Path
 from django.core.management.base import BaseCommand
 from django.conf import settings
 
+from ._output import write_section
+
 try:
     from jsmin import jsmin
     JSMIN_AVAILABLE = True
@@ -39,10 +41,7 @@ class Command(BaseCommand):
         )
 
     def handle(self, *args, **options):
-        self.stdout.write(self.style.SUCCESS('=' * 70))
-        self.stdout.write(self.style.SUCCESS('JavaScript Optimization for Production'))
-        self.stdout.write(self.style.SUCCESS('=' * 70))
-        self.stdout.write('')
+        write_section(self, 'JavaScript Optimization for Production', style_func=self.style.SUCCESS)
 
         if not JSMIN_AVAILABLE:
             self.stdout.write(self.style.WARNING(
@@ -141,10 +140,7 @@ class Command(BaseCommand):
             self.stdout.write('')
 
         # Summary
-        self.stdout.write(self.style.SUCCESS('=' * 70))
-        self.stdout.write(self.style.SUCCESS('Optimization Summary'))
-        self.stdout.write(self.style.SUCCESS('=' * 70))
-        self.stdout.write('')
+        write_section(self, 'Optimization Summary', style_func=self.style.SUCCESS)
         self.stdout.write(f'Total original size: {total_original_size:,} bytes ({total_original_size / 1024:.2f} KB)')
         
         if JSMIN_AVAILABLE and total_minified_size > 0:
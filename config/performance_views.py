@@ -6,15 +6,55 @@ Requirements: 14.6
 
 import json
 import logging
+import mmap
 from datetime import datetime, timedelta
 from django.http import JsonResponse
 from django.views.decorators.http import require_http_methods
 from django.views.decorators.csrf import csrf_exempt
 from django.utils import timezone
 from django.core.cache import cache
+from django.conf import settings
 
 logger = logging.getLogger('performance')
 
+# Monitoring settings never change within a process lifetime, so resolve them
+# once at import time instead of on every dashboard hit.
+_STATIC_CTX = {
+    'monitoring_enabled': getattr(settings, 'PERFORMANCE_MONITORING_ENABLED', False),
+    'slow_request_threshold': getattr(settings, 'PERFORMANCE_SLOW_REQUEST_THRESHOLD', 2.0),
+    'slow_query_threshold': getattr(settings, 'PERFORMANCE_SLOW_QUERY_THRESHOLD', 0.5),
+}
+
+# Read the path from the logging config so it can't drift from the file handler
+PERFORMANCE_LOG_FILE = settings.LOGGING['handlers']['performance_file']['filename']
+LOG_TAIL_LINES = 100
+
+
+def _tail_log_lines(log_file, max_lines=LOG_TAIL_LINES):
+    """
+    Return the last ``max_lines`` lines of a log file as bytes.
+
+    Memory-maps the file and scans backwards from EOF for newlines, so the
+    cost depends on the size of the tail rather than the size of the file.
+    """
+    try:
+        with open(log_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            end = mm.size()
+            # Ignore the trailing newline so it doesn't count as an empty line
+            pos = end - 1 if mm[end - 1:end] == b'\n' else end
+            start = 0
+            for _ in range(max_lines):
+                newline = mm.rfind(b'\n', 0, pos)
+                if newline == -1:
+                    start = 0
+                    break
+                start = newline + 1
+                pos = newline
+            return mm[start:end].splitlines()
+    except (OSError, ValueError):
+        # Missing or empty log file (mmap cannot map zero bytes)
+        return []
+
 
 @csrf_exempt
 @require_http_methods(["POST"])
@@ -124,15 +164,17 @@ def performance_dashboard(request):
     Endpoint: /performance/dashboard/
     Method: GET
     """
-    # Get metrics from cache for the last 24 hours
+    # Get metrics from cache for the last 24 hours (single round-trip)
     now = datetime.now()
+    cache_keys = [
+        f"perf_metrics_{(now - timedelta(hours=hour)).strftime('%Y%m%d_%H')}"
+        for hour in range(24)
+    ]
+    cached = cache.get_many(cache_keys)
     all_metrics = []
     
-    for hour in range(24):
-        timestamp = now - timedelta(hours=hour)
-        cache_key = f"perf_metrics_{timestamp.strftime('%Y%m%d_%H')}"
-        cached_metrics = cache.get(cache_key, [])
-        all_metrics.extend(cached_metrics)
+    for cache_key in cache_keys:
+        all_metrics.extend(cached.get(cache_key, []))
     
     # Calculate aggregates
     if all_metrics:
@@ -164,11 +206,23 @@ def performance_dashboard(request):
             'p75_lcp': 0,
         }
     
+    # Classify the tail of the server-side performance log
+    slow_requests = []
+    slow_queries = []
+    for line in _tail_log_lines(PERFORMANCE_LOG_FILE):
+        if b'Slow request detected' in line:
+            slow_requests.append(line.decode('utf-8', 'replace'))
+        elif b'Slow query detected' in line:
+            slow_queries.append(line.decode('utf-8', 'replace'))
+    
     return JsonResponse({
+        **_STATIC_CTX,
         'status': 'success',
         'period': '24 hours',
         'aggregates': aggregates,
-        'recent_metrics': all_metrics[-10:] if all_metrics else []
+        'recent_metrics': all_metrics[-10:] if all_metrics else [],
+        'slow_requests': slow_requests,
+        'slow_queries': slow_queries,
     })
 
 
@@ -11,6 +11,7 @@ https://docs.djangoproject.com/en/4.2/ref/settings/
 """
 
 import os
+import sys
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -30,6 +31,10 @@ if _env_file.exists():
                 os.environ.setdefault(_key.strip(), _val.strip())
 
 
+# True while running `manage.py test`; used for test-only speedups below
+TESTING = len(sys.argv) > 1 and sys.argv[1] == 'test'
+
+
 # Quick-start development settings - unsuitable for production
 # See https://docs.djangoproject.com/en/4.2/howto/deployment/checklist/
 
@@ -130,6 +135,12 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        # The SQLite test database lives in memory and is migrated from scratch
+        # on every run. Point TEST_DATABASE_NAME at a file to keep it between
+        # runs with `manage.py test --keepdb`.
+        'TEST': {
+            'NAME': os.environ.get('TEST_DATABASE_NAME') or None,
+        },
     }
 }
 
@@ -170,9 +181,12 @@ else:
 CACHE_TIMEOUT_RESUME_HEALTH = 300  # 5 minutes
 CACHE_TIMEOUT_ANALYTICS = 300  # 5 minutes
 CACHE_TIMEOUT_SCORE_TRENDS = 600  # 10 minutes
+CACHE_TIMEOUT_TEMPLATE_PREVIEW = 3600  # 1 hour
 
 # Performance Monitoring Settings (Requirements: 18.4)
-PERFORMANCE_MONITORING_ENABLED = DEBUG  # Only enable in development
+# Only enable in development; never under the test runner, where its
+# reset_queries() call would wipe assertNumQueries' captured queries
+PERFORMANCE_MONITORING_ENABLED = DEBUG and not TESTING
 PERFORMANCE_LOG_SLOW_QUERIES = True  # Log queries slower than threshold
 PERFORMANCE_SLOW_QUERY_THRESHOLD = 0.5  # seconds
 PERFORMANCE_LOG_SLOW_REQUESTS = True  # Log requests slower than threshold
@@ -197,6 +211,11 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# PBKDF2 is deliberately slow (~100ms per create_user/login). Test fixtures
+# don't need strong hashes, so use MD5 to keep the suite fast.
+if TESTING:
+    PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/4.2/topics/i18n/
@@ -482,6 +501,11 @@ LOGGING = {
     },
 }
 
+# Tests deliberately trigger errors and failed logins, and echoing every one
+# to stderr buries the runner's own report. The file handlers still record them.
+if TESTING:
+    LOGGING['handlers']['console'] = {'class': 'logging.NullHandler'}
+
 # Create logs directory if it doesn't exist
 import os
 LOGS_DIR = BASE_DIR / 'logs'
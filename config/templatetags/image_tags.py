@@ -16,7 +16,10 @@ Usage in templates:
 Requirements: 14.3, 14.4
 """
 
+from functools import lru_cache
+
 from django import template
+from django.contrib.staticfiles import finders
 from django.templatetags.static import static
 from django.utils.safestring import mark_safe
 from pathlib import Path
@@ -25,6 +28,23 @@ from django.conf import settings
 register = template.Library()
 
 
+@lru_cache(maxsize=256)
+def _webp_exists(src):
+    """
+    Check (once per process) whether a WebP sibling of a static image exists.
+
+    Looks in the collected STATIC_ROOT first, then the static source
+    directories where `optimize_images --webp` writes its output.
+    """
+    webp_src = str(Path(src).with_suffix('.webp'))
+    try:
+        if (Path(settings.STATIC_ROOT) / webp_src).exists():
+            return True
+        return finders.find(webp_src) is not None
+    except Exception:
+        return False
+
+
 @register.simple_tag
 def optimized_image(src, alt='', lazy=False, css_class='', width='', height=''):
     """
@@ -39,15 +59,12 @@ def optimized_image(src, alt='', lazy=False, css_class='', width='', height=''):
         height: Image height attribute
     
     Returns:
-        HTML picture element with WebP source and fallback
+        HTML picture element with WebP source and fallback, or a plain
+        img element when no WebP version exists
     """
     # Get static URL
     img_url = static(src)
     
-    # Check if WebP version exists
-    webp_src = Path(src).with_suffix('.webp')
-    webp_url = static(str(webp_src))
-    
     # Build attributes
     attrs = []
     if css_class:
@@ -62,7 +79,12 @@ def optimized_image(src, alt='', lazy=False, css_class='', width='', height=''):
     attrs_str = ' '.join(attrs)
     
     # Build HTML
-    # Try to use picture element with WebP source
+    # Only use a picture element when a WebP source actually exists,
+    # otherwise browsers request a missing file before falling back
+    if not _webp_exists(src):
+        return mark_safe(f'<img src="{img_url}" alt="{alt}" {attrs_str}>')
+    
+    webp_url = static(str(Path(src).with_suffix('.webp')))
     html = f'''<picture>
     <source srcset="{webp_url}" type="image/webp">
     <img src="{img_url}" alt="{alt}" {attrs_str}>
@@ -101,8 +123,4 @@ def webp_available(image_path):
     Usage:
         {% if 'images/hero.jpg'|webp_available %}
     """
-    try:
-        webp_path = Path(settings.STATIC_ROOT) / Path(image_path).with_suffix('.webp')
-        return webp_path.exists()
-    except:
-        return False
+    return _webp_exists(image_path)
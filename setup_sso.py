@@ -1,69 +1,90 @@
 """
 Run this once after adding credentials to .env:
     python setup_sso.py
+    python setup_sso.py --dry-run   # only report which credentials are configured
 
 Fixes:
   1. Sets Site domain to localhost:8000
   2. Creates/updates Google and LinkedIn SocialApp records from .env
 """
+import argparse
+import importlib
 import os
-import django
 
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
-django.setup()
+PROVIDERS = (
+    ('google',          'GOOGLE_CLIENT_ID',   'GOOGLE_CLIENT_SECRET',   'Google'),
+    ('linkedin_oauth2', 'LINKEDIN_CLIENT_ID', 'LINKEDIN_CLIENT_SECRET', 'LinkedIn'),
+)
 
-from django.contrib.sites.models import Site
-from allauth.socialaccount.models import SocialApp
 
-# ── 1. Fix Site domain ────────────────────────────────────────────────────────
-site, _ = Site.objects.get_or_create(pk=1)
-site.domain = 'localhost:8000'
-site.name   = 'NextGenCV'
-site.save()
-print(f'[OK] Site set to: {site.domain}')
+def bootstrap_django():
+    """Configure Django only when the ORM is actually needed."""
+    import django
 
-# ── 2. Google SocialApp ───────────────────────────────────────────────────────
-google_id     = os.environ.get('GOOGLE_CLIENT_ID', '').strip()
-google_secret = os.environ.get('GOOGLE_CLIENT_SECRET', '').strip()
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+    django.setup()
 
-if google_id and google_secret:
-    app, created = SocialApp.objects.get_or_create(
-        provider='google',
-        defaults={'name': 'Google'}
-    )
-    app.name      = 'Google'
-    app.client_id = google_id
-    app.secret    = google_secret
-    app.save()
-    app.sites.add(site)
-    status = 'created' if created else 'updated'
-    print(f'[OK] Google SocialApp {status} (client_id: {google_id[:12]}...)')
-else:
-    print('[WARN] GOOGLE_CLIENT_ID or GOOGLE_CLIENT_SECRET missing in .env — skipping Google')
 
-# ── 3. LinkedIn SocialApp ─────────────────────────────────────────────────────
-li_id     = os.environ.get('LINKEDIN_CLIENT_ID', '').strip()
-li_secret = os.environ.get('LINKEDIN_CLIENT_SECRET', '').strip()
+def dry_run():
+    """Report which providers would be configured, without touching the DB."""
+    # Importing the settings module loads .env into os.environ; no app registry needed.
+    importlib.import_module(os.environ.get('DJANGO_SETTINGS_MODULE', 'config.settings'))
+    for _, env_id_key, env_secret_key, label in PROVIDERS:
+        client_id = os.environ.get(env_id_key, '').strip()
+        secret    = os.environ.get(env_secret_key, '').strip()
+        if client_id and secret:
+            print(f'[DRY-RUN] {label} SocialApp would be created/updated (client_id: {client_id[:12]}...)')
+        else:
+            print(f'[DRY-RUN] {env_id_key} or {env_secret_key} missing in .env — {label} would be skipped')
 
-if li_id and li_secret:
-    app, created = SocialApp.objects.get_or_create(
-        provider='linkedin_oauth2',
-        defaults={'name': 'LinkedIn'}
-    )
-    app.name      = 'LinkedIn'
-    app.client_id = li_id
-    app.secret    = li_secret
-    app.save()
-    app.sites.add(site)
-    status = 'created' if created else 'updated'
-    print(f'[OK] LinkedIn SocialApp {status} (client_id: {li_id[:12]}...)')
-else:
-    print('[WARN] LINKEDIN_CLIENT_ID or LINKEDIN_CLIENT_SECRET missing in .env — skipping LinkedIn')
 
-# ── 4. Verify ─────────────────────────────────────────────────────────────────
-print('\n── Verification ──────────────────────────────────────────')
-print(f'Site:  {Site.objects.get(pk=1).domain}')
-for a in SocialApp.objects.all():
-    sites = list(a.sites.values_list('domain', flat=True))
-    print(f'App:   provider={a.provider}  client_id={a.client_id[:12]}...  sites={sites}')
-print('\nDone. Restart the dev server and try the SSO buttons.')
+def main():
+    from django.contrib.sites.models import Site
+    from allauth.socialaccount.models import SocialApp
+
+    # ── 1. Fix Site domain ────────────────────────────────────────────────────
+    site, _ = Site.objects.get_or_create(pk=1)
+    site.domain = 'localhost:8000'
+    site.name   = 'NextGenCV'
+    site.save()
+    print(f'[OK] Site set to: {site.domain}')
+
+    # ── 2. Provider SocialApps ────────────────────────────────────────────────
+    for provider, env_id_key, env_secret_key, label in PROVIDERS:
+        client_id = os.environ.get(env_id_key, '').strip()
+        secret    = os.environ.get(env_secret_key, '').strip()
+
+        if client_id and secret:
+            app, created = SocialApp.objects.get_or_create(
+                provider=provider,
+                defaults={'name': label}
+            )
+            app.name      = label
+            app.client_id = client_id
+            app.secret    = secret
+            app.save()
+            app.sites.add(site)
+            status = 'created' if created else 'updated'
+            print(f'[OK] {label} SocialApp {status} (client_id: {client_id[:12]}...)')
+        else:
+            print(f'[WARN] {env_id_key} or {env_secret_key} missing in .env — skipping {label}')
+
+    # ── 3. Verify ─────────────────────────────────────────────────────────────
+    print('\n── Verification ──────────────────────────────────────────')
+    print(f'Site:  {Site.objects.get(pk=1).domain}')
+    for a in SocialApp.objects.all():
+        sites = list(a.sites.values_list('domain', flat=True))
+        print(f'App:   provider={a.provider}  client_id={a.client_id[:12]}...  sites={sites}')
+    print('\nDone. Restart the dev server and try the SSO buttons.')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Configure the Site and SSO SocialApp records from .env.')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='Only report which providers have credentials; do not initialise Django or write to the DB.')
+    args = parser.parse_args()
+    if args.dry_run:
+        dry_run()
+    else:
+        bootstrap_django()
+        main()